@@ -26,6 +26,8 @@
     UseEscapingForWikiLinks = $False                    # Add Escape char in links when using Wikilinks. (Prevents broken tables, as Links and Tables both use "|".)
     UnderscoreHomepageTitles = $True                    # Prepend an underscore "_" in front of index file, to always sort it as first item alphabetically
     RemoveAllTagsFromIndex = $True                      # Removes all lines that contain tags in the index/homepage file (does not apply to other pages)
+    Incremental = $False                                # Skip pages whose Markdown output is newer than the source HTML (faster re-runs)
+    MaxWorkers = 0                                      # Number of pages converted in parallel (0 = automatic)
 
     ## Folder Names (default names don't need to be changed usually)
     AttachmentsPath = "attachments"                     # Attachments folder name
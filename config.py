@@ -29,6 +29,8 @@ class Config:
     BLOGPOST_LINK_REPLACEMENT: str = " (Blogpost)"
     BLOGPOST_LINK_REPLACEMENT_ENABLED: bool = True
     RENAME_ALL_FILES: bool = False
+    INCREMENTAL: bool = False
+    MAX_WORKERS: int = 0  # Parallel page conversions, 0 = automatic
     LOG_LINK_MAPPING: bool = False
     USE_UNDERSCORE_IN_FILENAMES: bool = False
     INSERT_YAML_HEADER: bool = False
@@ -2,15 +2,24 @@ import os
 import io
 import sys
 import logging
+import logging.handlers
+import queue
+import atexit
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor, Executor
 
 from attachmentprocessor import AttachmentProcessor
 from linkchecker import LinkChecker
 from xmlprocessor import XmlProcessor
 from conversionstats import ConversionStats
 from config import Config, load_config
-from htmlprocessor import HtmlProcessor
+from htmlprocessor import HtmlProcessor, read_text_file, write_text_file
+
+# CONSTANTS REGEX
+MD_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+# Pattern: (indent)(optional tab)(spaces)(asterisk)(spaces)(#label)(rest)
+LABEL_LINE_PATTERN = re.compile(r'^(\s*)(\t)?(\s*)\*\s+(#\S+)(.*)$')
 
 def parse_args() -> None:
     parser = argparse.ArgumentParser()
@@ -38,9 +47,12 @@ def setup_logging(config: Config) -> logging.Logger:
     console_handler.setLevel(getattr(logging, config.LOG_LEVEL_CONSOLE.upper()))
     console_handler.setFormatter(logging.Formatter('%(message)s'))
 
-    # Setup logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Setup logger: records are queued and written by a listener thread, so conversion threads don't block on IO
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush remaining records on exit
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
@@ -85,7 +97,9 @@ def main(config: Config, logger: logging.Logger) -> None:
 
         # Count total HTML files across all input folders
         print_status("Scanning Attachments...")
-        total_html_count = html_processor.count_html_files(input_folders)
+        html_manifest = html_processor.scan_html_files(input_folders)
+        total_html_count = html_processor.count_html_files(html_manifest)
+        space_folders = html_processor.list_space_folders(input_folders)
 
         logger.debug(f"Found {total_html_count} HTML files to process across all input folders")
         print_status(f"Found {total_html_count} HTML files to process...")
@@ -98,16 +112,14 @@ def main(config: Config, logger: logging.Logger) -> None:
         
         # Count XML files first
         xml_files_to_process = []
-        for input_folder in input_folders:
-            _, subfolders, _ = next(os.walk(input_folder))
-            for subfolder in subfolders:
-                # Skip special folders
-                if html_processor._get_special_folder_type(subfolder) is not None:
-                    continue
-                
-                exists, xml_path = xml_processor.verify_xml_file(subfolder, config, logger=logger)
-                if exists:
-                    xml_files_to_process.append(xml_path)
+        for subfolder in space_folders:
+            # Skip special folders
+            if html_processor._get_special_folder_type(subfolder) is not None:
+                continue
+
+            exists, xml_path = xml_processor.verify_xml_file(subfolder, config, logger=logger)
+            if exists:
+                xml_files_to_process.append(xml_path)
         
         # Set total XML files to process
         link_checker.attachment_processor.xml_processor.stats.total = len(xml_files_to_process)
@@ -129,54 +141,49 @@ def main(config: Config, logger: logging.Logger) -> None:
         # Create a mapping for attachments
         print("")  # add newline to prevent cluttering
         print_status("Mapping Attachments...")
-        for input_folder in input_folders:
-            _, subfolders, _ = next(os.walk(input_folder))
-            for subfolder in subfolders:
-                # Skip special folders
-                if html_processor._get_special_folder_type(subfolder) == config.STYLES_PATH:
-                    logger.debug(f"Skipping folder: {subfolder}")
-                    continue
-
-                # Verify XML file exists for this space
-                exists, xml_path = link_checker.attachment_processor.xml_processor.verify_xml_file(subfolder, config, logger)
+        for subfolder in space_folders:
+            # Skip special folders
+            if html_processor._get_special_folder_type(subfolder) == config.STYLES_PATH:
+                logger.debug(f"Skipping folder: {subfolder}")
+                continue
+
+            # Verify XML file exists for this space
+            exists, xml_path = link_checker.attachment_processor.xml_processor.verify_xml_file(subfolder, config, logger)
+
+            if exists:
+                # Process attachments
+                logger.info(f"Building attachment mapping from XML: {xml_path}")
+                # Get the space directory name from subfolder
+                space_dir = os.path.basename(subfolder)
+                link_checker.attachment_processor.process_xml_attachments(xml_path)
+                link_checker.attachment_processor.process_space_attachments(space_dir)
+                link_checker.attachment_processor.generate_mapping_file()
+                link_checker.attachment_processor.copy_images_folder(subfolder, config, logger)
 
-                if exists:
-                    # Process attachments
-                    logger.info(f"Building attachment mapping from XML: {xml_path}")
-                    # Get the space directory name from subfolder
-                    space_dir = os.path.basename(subfolder)
-                    link_checker.attachment_processor.process_xml_attachments(xml_path)
-                    link_checker.attachment_processor.process_space_attachments(space_dir)
-                    link_checker.attachment_processor.generate_mapping_file()
-                    link_checker.attachment_processor.copy_images_folder(subfolder, config, logger)
-
-                else:
-                    logger.warning(f"No XML file found for space: {subfolder}. Skipping attachment processing.")
+            else:
+                logger.warning(f"No XML file found for space: {subfolder}. Skipping attachment processing.")
 
         # Log the total number of pages found
         logger.info(f"Total pages found across all XML files: {len(link_checker.attachment_processor.xml_processor.page)}")
 
         # Create tag mapping from HTML content-by-label sections
         print_status("Mapping Tags to pages...")
-        html_processor.create_tag_mapping_from_html(input_folders, link_checker)
+        html_processor.create_tag_mapping_from_html(html_manifest, link_checker)
 
         # Third pass: Convert HTML files to Markdown for all input folders
         print_status("Converting HTML files to Markdown...")
         link_checker.attachment_processor.xml_processor.stats.set_phase("Converting")  # Start conversion phase
         link_checker.attachment_processor.xml_processor.stats.total = total_html_count
 
-        for input_folder in input_folders:
-            for root, _, files in os.walk(input_folder):
-                # Skip special folders
-                if html_processor._get_special_folder_type(root) is not None:
-                    continue
-
+        # Pages are independent, so convert them on a thread pool (MAX_WORKERS 0 = automatic)
+        with ThreadPoolExecutor(max_workers=config.MAX_WORKERS or None) as executor:
+            for input_folder, root, html_files in html_manifest:
                 rel_path = os.path.relpath(root, input_folder)
                 output_dir = os.path.join(config.OUTPUT_FOLDER, rel_path)
                 os.makedirs(output_dir, exist_ok=True)
 
                 # Process HTML files (convert only)
-                _process_html_files(root, files, output_dir, config, link_checker, html_processor)
+                _process_html_files(root, html_files, output_dir, config, link_checker, html_processor, executor)
 
         # Update phase stats after converting
         link_checker.attachment_processor.xml_processor.stats.update_phase_stats()
@@ -193,7 +200,7 @@ def main(config: Config, logger: logging.Logger) -> None:
         print("") # add newline to prevent cluttering
         print_status("Fixing crosslinks in all Markdown files...")
         link_checker.attachment_processor.xml_processor.stats.set_phase("Fixing links")  # Start conversion phase
-        _fix_md_crosslinks(config.OUTPUT_FOLDER, link_checker)
+        _fix_md_crosslinks(config.OUTPUT_FOLDER, link_checker, html_processor.skipped_outputs)
         # Update phase stats after fixing links
         link_checker.attachment_processor.xml_processor.stats.update_phase_stats()
 
@@ -219,13 +226,15 @@ def main(config: Config, logger: logging.Logger) -> None:
         print_status(str(e), error=True)
         sys.exit(1)
 
-def _process_html_files(root: str, files: list, output_dir: str, config: Config, link_checker: LinkChecker, html_processor: HtmlProcessor) -> None:
-    """Convert HTML files to Markdown and collect filename mappings"""
-    html_files: str = [f for f in files if f.endswith('.html')]
+def _process_html_files(root: str, html_files: list, output_dir: str, config: Config, link_checker: LinkChecker, html_processor: HtmlProcessor, executor: Executor) -> None:
+    """Convert HTML files to Markdown on the given executor and collect the results"""
+    stats = link_checker.attachment_processor.xml_processor.stats
 
     # Log all HTML files found in this directory
     logger.info(f"Found {len(html_files)} HTML files in {root}")
     
+    # Submit all conversions first; statistics are only updated here in the calling thread
+    conversions = []
     for filename in html_files:
         input_file = os.path.join(root, filename)
         logger.debug(f"Processing HTML file: {input_file}")
@@ -233,60 +242,75 @@ def _process_html_files(root: str, files: list, output_dir: str, config: Config,
         # Check if file should be skipped (e.g., in special folders)
         if html_processor._is_special_folder(input_file):
             logger.info(f"Skipping file in special folder: {input_file}")
-            link_checker.attachment_processor.xml_processor.stats.skip_file("Converting")
+            stats.skip_file("Converting")
             continue
 
-        link_checker.attachment_processor.xml_processor.stats.processed += 1
         md_output_name = os.path.join(output_dir, filename[:-5] + ".md")
+        future = executor.submit(html_processor.convert_html_to_md, input_file, md_output_name, link_checker)
+        conversions.append((filename, future))
 
-        logger.info(f"Processing file {link_checker.attachment_processor.xml_processor.stats.processed}/{link_checker.attachment_processor.xml_processor.stats.total}: {filename}")
+    for filename, future in conversions:
+        stats.processed += 1
+        logger.info(f"Processed file {stats.processed}/{stats.total}: {filename}")
 
         try:
-            if html_processor.convert_html_to_md(input_file, md_output_name, link_checker):
-                link_checker.attachment_processor.xml_processor.stats.success += 1
+            if future.result():
+                stats.success += 1
             else:
-                print_status(f"Failed to convert {os.path.basename(input_file)}", error=True)
-                link_checker.attachment_processor.xml_processor.stats.failure += 1
+                print_status(f"Failed to convert {filename}", error=True)
+                stats.failure += 1
         except Exception as e:
             logger.error(f"Failed to convert {filename}: {str(e)}")
-            link_checker.attachment_processor.xml_processor.stats.failure += 1
+            stats.failure += 1
 
-        link_checker.attachment_processor.xml_processor.stats.update_progress()
+        stats.update_progress()
 
     # Update phase stats after processing
     link_checker.attachment_processor.xml_processor.stats.update_phase_stats()
 
-def _fix_md_crosslinks(output_dir: str, link_checker: LinkChecker) -> None:
+def _fix_md_crosslinks(output_dir: str, link_checker: LinkChecker, skipped_files: set = frozenset()) -> None:
     """
     Fix cross-references in Markdown files to use ID-based links.
 
     Args:
         output_dir (str): The output directory containing Markdown files
+        skipped_files (set): Normalized paths of files that were not converted in this run
     """
     logger.info("Fixing cross-links in Markdown files using ID")
 
-    # Get all markdown files
+    # Get all markdown files, except the unchanged ones of incremental runs (their links are
+    # already fixed and fixing them again would corrupt already resolved links)
     md_files = []
     for root, _, files in os.walk(output_dir):
         for file in files:
             if file.endswith('.md'):
-                md_files.append(os.path.join(root, file))
+                md_file = os.path.join(root, file)
+                if os.path.normpath(md_file) in skipped_files:
+                    logger.debug(f"Skipping unchanged file: {md_file}")
+                    continue
+                md_files.append(md_file)
+
+    # Bind frequently used objects once
+    xml_processor = link_checker.attachment_processor.xml_processor
+    stats = xml_processor.stats
+    convert_wikilink = link_checker.convert_wikilink
+    debug = logger.isEnabledFor(logging.DEBUG)  # Skip building per-link debug messages when disabled
 
     # Set up statistics
-    link_checker.attachment_processor.xml_processor.stats.total = len(md_files)
-    link_checker.attachment_processor.xml_processor.stats.processed = 0
-    link_checker.attachment_processor.xml_processor.stats.success = 0
-    link_checker.attachment_processor.xml_processor.stats.failure = 0
+    stats.total = len(md_files)
+    stats.processed = 0
+    stats.success = 0
+    stats.failure = 0
     total_links_fixed = 0
 
     # Get all Homepage files
-    all_spaces = link_checker.attachment_processor.xml_processor.spaces
+    all_spaces = xml_processor.spaces
 
     all_homepages = {}
     for _, space_data in all_spaces.items():
         homepage_id = space_data["homePageId"]
         space_name = space_data["name"]
-        title = link_checker.attachment_processor.xml_processor.get_page_title_by_id(homepage_id)
+        title = xml_processor.get_page_title_by_id(homepage_id)
         all_homepages[title] = {
             "space_name": space_name,
             "homepage_id": homepage_id,
@@ -296,139 +320,133 @@ def _fix_md_crosslinks(output_dir: str, link_checker: LinkChecker) -> None:
     # Create a set of homepage filenames (title + ".md")
     homepage_filenames = {f"{title}.md" for title in all_homepages}
 
-    # Process each file
-    for md_file in md_files:
-        link_checker.attachment_processor.xml_processor.stats.processed += 1
-        logger.info(f"Processing file {link_checker.attachment_processor.xml_processor.stats.processed}/{link_checker.attachment_processor.xml_processor.stats.total}: {md_file}")
-
+    def fix_file(md_file: str) -> int:
+        """Fix the links of one Markdown file in place, returns the number of links fixed"""
         # Get the directory of the current file for context
         current_dir = os.path.dirname(os.path.relpath(md_file, output_dir))
 
         # Now check if md_file matches any homepage filename
         is_index_file = os.path.basename(md_file) in homepage_filenames
 
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            if md_file == 'output\\WER\\Arbeitssicherheit.md':
-                logger.debug(f"Processing specific file: {md_file} with content")
-                #logger.debug(f"--- Start of content ---")
-                #logger.debug(content)
-                #logger.debug(f"--- End of content ---")
-
-            # Find all markdown links
-            link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-
-            # Create a counter object that can be accessed by the nested function
-            counter = {'links_fixed': 0}
+        content = read_text_file(md_file)
+        
+        # Create a counter object that can be accessed by the nested function
+        counter = {'links_fixed': 0}
 
-            def replace_link(match):
-                description = match.group(1)
-                link = match.group(2).strip('<>')
+        def replace_link(match):
+            description = match.group(1)
+            link = match.group(2).strip('<>')
 
-                # Process the link
-                new_link = _process_link(link, current_dir, link_checker)
+            # Process the link
+            new_link = _process_link(link, current_dir, link_checker)
+            if debug:
                 logger.debug(f"Processed link: '{link}' -> '{new_link}'")
 
-                # Return the updated link
-                if new_link:
-                    counter['links_fixed'] += 1
-                    # tag
-                    if new_link.startswith('#'):
-                        return new_link
-                    # username
-                    elif new_link.startswith('@'):
-                        return new_link[1:]  # remove @ sign
-                    # regular link
-                    else:
-                        if config.BLOGPOST_LINK_REPLACEMENT_ENABLED and description == config.BLOGPOST_LINK_INDICATOR:
-                            new_description = os.path.splitext(os.path.basename(new_link))[0] + config.BLOGPOST_LINK_REPLACEMENT
-                            logger.debug(f"Updated description from '{description}' to: '{new_description}'")
-                            return link_checker.convert_wikilink(new_description, new_link)
-                        return link_checker.convert_wikilink(description, new_link)
+            # Return the updated link
+            if new_link:
+                counter['links_fixed'] += 1
+                # tag
+                if new_link.startswith('#'):
+                    return new_link
+                # username
+                elif new_link.startswith('@'):
+                    return new_link[1:]  # remove @ sign
+                # regular link
                 else:
-                    return description  # Just return the description if link was removed
-
-            # Replace all links
-            updated_content = link_pattern.sub(replace_link, content)
-
-            def fix_label_lines(content):
-                lines = content.splitlines()
-                new_lines = []
-                # Pattern: (indent)(optional tab)(spaces)(asterisk)(spaces)(#label)(rest)
-                label_line_re = re.compile(r'^(\s*)(\t)?(\s*)\*\s+(#\S+)(.*)$')
-
-                for line in lines:
-                    m = label_line_re.match(line)
-                    # replace labels for all pages
-                    if m:
-                        indent = m.group(1)        # leading whitespace
-                        mid_space = m.group(3)     # spaces between tab/indent and asterisk
-                        label = m.group(4)         # the #label
-                        rest = m.group(5)          # anything after the label
-
-                        # remove labels inside homepage
-                        if config.REMOVE_ALL_TAGS_FROM_INDEX and is_index_file:
-                            logger.debug(f"Removing label line in homepage: {line}")
-                            new_line = ""
-                        # Check if rest contains only whitespace/tabs
-                        elif rest.strip():
-                            # Rest contains non-whitespace characters - keep it
-                            new_line = f"- {label}{rest}"
-                            #new_line = f"{indent}{mid_space}- {label}{rest}"
-                            new_lines.append(new_line)
-                            logger.debug(f"Append label: {new_line}")
-                        else:
-                            # Rest is only whitespace/tabs - remove it
-                            #new_line = f"{indent}{mid_space}- {label}"
-                            new_line = f"- {label}"
-                            new_lines.append(new_line)
-                            logger.debug(f"Append label: {new_line}")
-                    # remove special characters
+                    if config.BLOGPOST_LINK_REPLACEMENT_ENABLED and description == config.BLOGPOST_LINK_INDICATOR:
+                        new_description = os.path.splitext(os.path.basename(new_link))[0] + config.BLOGPOST_LINK_REPLACEMENT
+                        logger.debug(f"Updated description from '{description}' to: '{new_description}'")
+                        return convert_wikilink(new_description, new_link)
+                    return convert_wikilink(description, new_link)
+            else:
+                return description  # Just return the description if link was removed
+
+        # Replace all links
+        updated_content = MD_LINK_PATTERN.sub(replace_link, content)
+
+        def fix_label_lines(content):
+            lines = content.splitlines()
+            new_lines = []
+
+            for line in lines:
+                m = LABEL_LINE_PATTERN.match(line)
+                # replace labels for all pages
+                if m:
+                    indent = m.group(1)        # leading whitespace
+                    mid_space = m.group(3)     # spaces between tab/indent and asterisk
+                    label = m.group(4)         # the #label
+                    rest = m.group(5)          # anything after the label
+
+                    # remove labels inside homepage
+                    if config.REMOVE_ALL_TAGS_FROM_INDEX and is_index_file:
+                        logger.debug(f"Removing label line in homepage: {line}")
+                        new_line = ""
+                    # Check if rest contains only whitespace/tabs
+                    elif rest.strip():
+                        # Rest contains non-whitespace characters - keep it
+                        new_line = f"- {label}{rest}"
+                        #new_line = f"{indent}{mid_space}- {label}{rest}"
+                        new_lines.append(new_line)
+                        logger.debug(f"Append label: {new_line}")
                     else:
-                        if line.endswith('  · '):
-                            line.replace('  · ','')
-                            logger.debug(f"Removed trailing special character from line: {line}")
-                        new_lines.append(line)
-                return '\n'.join(new_lines)
-
-            # Apply the label line fix
-            updated_content = fix_label_lines(updated_content)
-
-            # Write the updated content
-            with open(md_file, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-
-            # Get the count from our counter object
-            links_fixed = counter['links_fixed']
-            logger.debug(f"Updated {links_fixed} links in {md_file}")
-            total_links_fixed += links_fixed
-
-            # Update the stats with the number of links fixed
-            if hasattr(link_checker.attachment_processor.xml_processor.stats, 'increment_links_fixed'):
-                link_checker.attachment_processor.xml_processor.stats.increment_links_fixed(links_fixed)
-            elif 'Fixing links' in link_checker.attachment_processor.xml_processor.stats.phase_stats and 'links_fixed' in link_checker.attachment_processor.xml_processor.stats.phase_stats['Fixing links']:
-                link_checker.attachment_processor.xml_processor.stats.phase_stats['Fixing links']['links_fixed'] += links_fixed
-                
-            link_checker.attachment_processor.xml_processor.stats.success += 1
+                        # Rest is only whitespace/tabs - remove it
+                        #new_line = f"{indent}{mid_space}- {label}"
+                        new_line = f"- {label}"
+                        new_lines.append(new_line)
+                        logger.debug(f"Append label: {new_line}")
+                # remove special characters
+                else:
+                    if line.endswith('  · '):
+                        line.replace('  · ','')
+                        logger.debug(f"Removed trailing special character from line: {line}")
+                    new_lines.append(line)
+            return '\n'.join(new_lines)
 
-        except Exception as e:
-            logger.error(f"Error fixing links in {md_file}: {str(e)}")
-            link_checker.attachment_processor.xml_processor.stats.failure += 1
+        # Apply the label line fix
+        updated_content = fix_label_lines(updated_content)
+
+        # Write the updated content
+        write_text_file(md_file, updated_content)
+
+        # Get the count from our counter object
+        return counter['links_fixed']
+
+    # Files are independent, so fix them on a thread pool; statistics are only updated here
+    with ThreadPoolExecutor(max_workers=config.MAX_WORKERS or None) as executor:
+        fixes = [(md_file, executor.submit(fix_file, md_file)) for md_file in md_files]
+
+        for md_file, future in fixes:
+            stats.processed += 1
+            logger.info(f"Processing file {stats.processed}/{stats.total}: {md_file}")
+
+            try:
+                links_fixed = future.result()
+                logger.debug(f"Updated {links_fixed} links in {md_file}")
+                total_links_fixed += links_fixed
+
+                # Update the stats with the number of links fixed
+                if hasattr(stats, 'increment_links_fixed'):
+                    stats.increment_links_fixed(links_fixed)
+                elif 'Fixing links' in stats.phase_stats and 'links_fixed' in stats.phase_stats['Fixing links']:
+                    stats.phase_stats['Fixing links']['links_fixed'] += links_fixed
+
+                stats.success += 1
+
+            except Exception as e:
+                logger.error(f"Error fixing links in {md_file}: {str(e)}")
+                stats.failure += 1
 
-        link_checker.attachment_processor.xml_processor.stats.update_progress()
+            stats.update_progress()
 
-    if link_checker.attachment_processor.xml_processor.stats.processed > 0:
-        avg_links = total_links_fixed / link_checker.attachment_processor.xml_processor.stats.processed
+    if stats.processed > 0:
+        avg_links = total_links_fixed / stats.processed
         logger.info(f"  Average links per file: {avg_links:.2f}")
     else:
         logger.info("  No files were processed for link fixing")
 
     logger.info(f"Link fixing summary:")
-    logger.info(f"  Total files processed: {link_checker.attachment_processor.xml_processor.stats.processed}")
+    logger.info(f"  Total files processed: {stats.processed}")
     logger.info(f"  Total links fixed: {total_links_fixed}")
-    logger.info(f"  Average links per file: {total_links_fixed / link_checker.attachment_processor.xml_processor.stats.processed:.2f}")
 
 def _process_link(link: str, current_dir: str, link_checker: LinkChecker) -> str:
     """
@@ -1,8 +1,10 @@
 import os
 import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Tuple, List, Any
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import html2text
 from urllib.parse import unquote
 import unicodedata
@@ -11,6 +13,16 @@ from config import Config
 from linkchecker import LinkChecker
 from confluencetaghandler import convert_custom_tags_to_html
 
+# Use the faster lxml parser for strained partial parses if it is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+CONTENT_BY_LABEL_STRAINER = SoupStrainer('ul', class_='content-by-label')  # Parse only label lists when mapping tags
+BLOG_LISTING_STRAINER = SoupStrainer('div', class_='blog-post-listing')  # Parse only blog listings of skipped pages
+
 # Define comprehensive multilingual month mapping
 MONTH_PATTERNS = {
     # English
@@ -35,8 +47,39 @@ MONTH_PATTERNS = {
     # Dutch
     "Mei": "05", "Mrt": "03", "Okt": "10"
 }
-FOOTER_PATTERN = r'\nDocument generated by Confluence on [A-Za-z]+\. \d{1,2}, \d{4} \d{1,2}:\d{2}\n\n\[Atlassian\]\(<https://www\.atlassian\.com/>\)\n*$'
-INVALID_CHARS = re.compile(r'[+/\\:*?&"<>|^\[\]]')
+FOOTER_PATTERN = re.compile(r'\nDocument generated by Confluence on [A-Za-z]+\. \d{1,2}, \d{4} \d{1,2}:\d{2}\n\n\[Atlassian\]\(<https://www\.atlassian\.com/>\)\n*$')
+INVALID_CHARS_TABLE = str.maketrans(dict.fromkeys('+/\\:*?&"<>|^[]', '-'))  # Characters replaced by dashes in filenames
+HEADING_LINE_PATTERN = re.compile(r'^[^\S\n]*(#+)', re.MULTILINE)  # Line starting with '#' after optional whitespace
+CREATED_BY_PATTERN = re.compile(r'Created by\s+.*(?:on|last modified).*\d+.*')  # 'Created by ... on <date>' line
+CREATED_BY_LINE_PATTERN = re.compile(r'^Created by[^\S\n]+.*(?:on|last modified).*\d+.*', re.MULTILINE)  # Same, searched in the whole text
+SPECIAL_LINE_BREAKS_PATTERN = re.compile('[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]')  # Line breaks other than '\n' (see str.splitlines)
+ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})')  # XML creationDate prefix
+SPACE_DETAILS_ROW_PATTERN = re.compile(r'(Name|Created by)\s*\|\s*([^\n|]+)')  # Space Details table: name and creator rows
+PARENTHESES_PATTERN = re.compile(r'\(([^)]+)\)')
+MONTH_DATE_PATTERN = re.compile(r'(\w+)\.?\s+(\d{1,2}),\s+(\d{4})')  # e.g. "Feb. 03, 2017"
+YAML_PLACEHOLDER_PATTERN = re.compile(r'author: \[username\]|dateCreated: \[date_created\]|\[\[up_field\]\]')
+READ_BATCH_SIZE = 64  # Files read ahead concurrently during the tag mapping pass
+
+def read_text_file(path: str) -> str:
+    """Read a UTF-8 text file in one call, normalizing line endings like text mode does"""
+    with open(path, 'rb') as f:
+        content = f.read().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def write_text_file(path: str, *parts: str) -> int:
+    """Encode and write the given text parts back-to-back into one UTF-8 file, returns the number of bytes written"""
+    size = 0
+    with open(path, 'wb') as f:
+        for content in parts:
+            data = content.encode('utf-8')
+            # Translate line endings on the encoded bytes ('\n' is a single byte in UTF-8)
+            if os.linesep != '\n':
+                data = data.replace(b'\n', os.linesep.encode('ascii'))
+            f.write(data)
+            size += len(data)
+    return size
 
 class HtmlProcessor:
     def __init__(self, config: Config, logger: logging.Logger):
@@ -45,6 +88,10 @@ class HtmlProcessor:
         self.logger = logger
         self.page_tag_mapping = {}  # Maps tags to page IDs
         self.blog_post_tags: Dict[str, List[str]] = {}  # Storage for blog post tags
+        self._local = threading.local()  # Per-thread reused Markdown converter (html2text is not thread-safe)
+        self._line_removal_patterns = {}  # Compiled line removal patterns per LINES_TO_REMOVE list
+        self.skipped_outputs = set()  # Outputs left unchanged by INCREMENTAL, their links were already fixed by an earlier run
+        self._valid_char_table = {}  # Code point -> itself, or None if is_valid_char rejects it (translate table)
 
     def _convert_blog_html_to_md(self, blog_post: dict, output_dir: str, link_checker: LinkChecker) -> str:
         """
@@ -98,14 +145,13 @@ class HtmlProcessor:
         markdown_content = link_checker.process_images(html_content, markdown_content)
         markdown_content = link_checker.process_attachment_links(markdown_content)
 
-        # Add YAML header
+        # Build YAML header, written directly in front of the Markdown content
+        yaml_header = ""
         if self.config.YAML_HEADER_BLOG:
-            # Combine YAML header and Markdown content
-            markdown_content = self._insert_yaml_header_md_blogpost(markdown_content, blog_post, link_checker)
+            yaml_header = self._build_yaml_header_md_blogpost(blog_post, link_checker)
 
         # Save the markdown file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        write_text_file(output_path, yaml_header, markdown_content)
 
         self.logger.info(f"Saved blog post to: {output_path}")
         return output_path
@@ -120,39 +166,46 @@ class HtmlProcessor:
                 self.logger.warning("Empty HTML content provided to converter")
                 return ""
 
-            # Configure html2text
-            h = html2text.HTML2Text()
-            h.ignore_links = False
-            h.ignore_images = False
-            h.ignore_tables = False
-            h.body_width = 0
-            h.protect_links = True
-            h.unicode_snob = True
-            h.mark_code = True
-
-            # Enhanced table settings
-            h.pad_tables = True
-            h.single_line_break = False
-            h.wrap_links = False
-            h.wrap_list_items = False
-            h.escape_all = False
-            h.bypass_tables = False
-            h.ignore_emphasis = False
-            h.skip_internal_links = False
-            h.decode_errors = 'ignore'
-            h.default_image_alt = ''
+            # Reuse this thread's configured converter (html2text clears its output buffer after each document)
+            converter = getattr(self._local, 'html2text', None)
+            if converter is None:
+                converter = self._local.html2text = self._create_html2text()
 
             # convert and return
-            return h.handle(html_content)
+            return converter.handle(html_content)
 
         except Exception as e:
+            # Drop the converter so a half-parsed document cannot leak into the next one
+            self._local.html2text = None
             self.logger.debug(f"Failed to convert HTML to Markdown: {e}")
             raise Exception(f"HTML to Markdown conversion failed: {e}")
 
-    def _preprocess_tables(self, html_content):
-        """Preprocess tables while preserving ALL content including nested elements"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-
+    def _create_html2text(self) -> html2text.HTML2Text:
+        """Create a configured html2text converter"""
+        h = html2text.HTML2Text()
+        h.ignore_links = False
+        h.ignore_images = False
+        h.ignore_tables = False
+        h.body_width = 0
+        h.protect_links = True
+        h.unicode_snob = True
+        h.mark_code = True
+
+        # Enhanced table settings
+        h.pad_tables = True
+        h.single_line_break = False
+        h.wrap_links = False
+        h.wrap_list_items = False
+        h.escape_all = False
+        h.bypass_tables = False
+        h.ignore_emphasis = False
+        h.skip_internal_links = False
+        h.decode_errors = 'ignore'
+        h.default_image_alt = ''
+        return h
+
+    def _preprocess_tables(self, soup: BeautifulSoup) -> None:
+        """Preprocess tables in place while preserving ALL content including nested elements"""
         # First, convert Confluence attachments to clean links
         self._convert_confluence_attachments_to_links(soup)
 
@@ -181,7 +234,7 @@ class HtmlProcessor:
 
             # Fix the main issue: Convert problematic tags inside cells to inline content
             for cell in table.find_all(['td', 'th']):
-                # Remove cell attributes but keep content
+                # Remove cell attributes (including colspan/rowspan) but keep content
                 cell.attrs = {}
 
                 # Convert <br/> tags to spaces (they cause line breaks in markdown)
@@ -209,7 +262,7 @@ class HtmlProcessor:
                             content.replace_with(cleaned)
 
                 # Handle truly empty cells
-                if not cell.get_text(strip=True) and not cell.find_all():
+                if not cell.get_text(strip=True) and cell.find() is None:
                     cell.string = " "
 
             # Ensure proper table structure
@@ -253,16 +306,6 @@ class HtmlProcessor:
                         row.append(empty_cell)
                         current_cols += 1
 
-            # Handle colspan/rowspan
-            for cell in table.find_all(['td', 'th']):
-                if cell.get('colspan') or cell.get('rowspan'):
-                    if 'colspan' in cell.attrs:
-                        del cell.attrs['colspan']
-                    if 'rowspan' in cell.attrs:
-                        del cell.attrs['rowspan']
-
-        return str(soup)
-
     def _convert_confluence_attachments_to_links(self, soup: BeautifulSoup) -> None:
         """Convert Confluence attachment elements to direct markdown links"""
 
@@ -401,7 +444,8 @@ class HtmlProcessor:
             href = link.get('href', '')
 
             # Skip if already processed or if it's an internal confluence link
-            if (link.get('class') and 'confluence-embedded-file' in link.get('class', [])):
+            link_class = link.get('class')
+            if link_class and 'confluence-embedded-file' in link_class:
                 continue
 
             # Only process external links (http/https)
@@ -419,7 +463,7 @@ class HtmlProcessor:
         # 5. Handle any remaining confluence-specific elements
         # Remove confluence-specific wrapper spans that might be empty now
         for wrapper in soup.find_all('span', class_='confluence-embedded-file-wrapper'):
-            if not wrapper.get_text(strip=True) and not wrapper.find_all():
+            if not wrapper.get_text(strip=True) and wrapper.find() is None:
                 wrapper.decompose()
 
         # 6. Handle macro placeholders and other confluence elements
@@ -443,18 +487,12 @@ class HtmlProcessor:
             str: The cleaned markdown content starting with the first heading
         """
         # Find the first line that starts with '#'
-        lines = markdown_content.split('\n')
-        start_index = 0
-
-        for i, line in enumerate(lines):
-            if line.strip().startswith('#'):
-                start_index = i
-                break
+        match = HEADING_LINE_PATTERN.search(markdown_content)
+        if not match:
+            return markdown_content
 
         # Return all content starting from the first heading
-        result = '\n'.join(lines[start_index:])
-
-        return result
+        return markdown_content[match.start():]
 
     def _remove_space_details(self, markdown_content: str) -> str:
         """
@@ -471,41 +509,43 @@ class HtmlProcessor:
         space_header = self.config.SPACE_DETAILS_SECTION
 
         # Check if the Space Details header exists
-        if space_header not in markdown_content:
+        header_pos = markdown_content.find(space_header)
+        if header_pos < 0:
             # If not found, return the original content unchanged
             return markdown_content
-        
-        # Split the content at the Space Details header
-        parts = markdown_content.split(space_header, 1)
-        before_header = parts[0]
-        after_header = parts[1]
 
-        # Find the next H1 or H2 header
-        lines = after_header.split('\n')
-        end_index = len(lines)  # Default to end of section
-
-        for i, line in enumerate(lines):
-            # Check if this line starts a new H1 or H2 section
-            if line.strip().startswith('#'):
-                end_index = i
-                break
+        before_header = markdown_content[:header_pos]
+        end_pos = self._find_space_details_end(markdown_content, header_pos)
 
         # Reconstruct the content without the Space Details section
-        if end_index < len(lines):
+        if end_pos >= 0:
             # There is another section after Space Details
-            result = before_header + '\n'.join(lines[end_index:])
+            result = before_header + markdown_content[end_pos:]
         else:
             # Space Details was the only section
             result = before_header.rstrip()
 
         return result
 
+    def _find_space_details_end(self, markdown_content: str, header_pos: int) -> int:
+        """Position of the header that ends the Space Details section found at header_pos, -1 if no section follows"""
+        after_pos = header_pos + len(self.config.SPACE_DETAILS_SECTION)
+
+        # Find the next H1 or H2 header, starting with the rest of the header line
+        line_end = markdown_content.find('\n', after_pos)
+        if line_end < 0:
+            line_end = len(markdown_content)
+        if markdown_content[after_pos:line_end].strip().startswith('#'):
+            return after_pos
+        match = HEADING_LINE_PATTERN.search(markdown_content, line_end)
+        return match.start() if match else -1
+
     def _remove_confluence_footer(self, markdown_content: str) -> str:
         """Remove the standard Confluence footer from markdown content"""
         self.logger.debug("Removing Confluence footer from markdown content")
         
         # Remove the footer
-        cleaned_content = re.sub(FOOTER_PATTERN, '', markdown_content)
+        cleaned_content = FOOTER_PATTERN.sub('', markdown_content)
         return cleaned_content
 
     def _remove_markdown_section(self, markdown_content: str, section_header: str) -> str:
@@ -529,60 +569,36 @@ class HtmlProcessor:
         self.logger.debug(f"Removing section '{section_header}' from markdown content")
 
         # Check if the section exists
-        if section_header not in markdown_content:
+        section_pos = markdown_content.find(section_header)
+        if section_pos < 0:
             self.logger.debug(f"No '{section_header}' section found")
             return markdown_content
 
         # Determine the heading level (count the leading # symbols)
-        heading_level = 0
-        for char in section_header:
-            if char == '#':
-                heading_level += 1
-            elif char != '#':
-                # Stop if we hit any other character
-                break
+        heading_level = len(section_header) - len(section_header.lstrip('#'))
 
-        # Split content at the section header
-        parts = markdown_content.split(section_header, 1)
-        before_section = parts[0]
-        section_and_after = section_header + parts[1]
-
-        # Find the next section at the same level or higher
-        lines = section_and_after.split('\n')
-        end_index = len(lines)  # Default to end of document
-
-        for i, line in enumerate(lines[1:], 1):  # Skip the section header line
-            # Check if this line starts a new section
-            line_stripped = line.strip()
-            if line_stripped.startswith('#'):
-                # Count the # symbols until the first space
-                line_heading_level = 0
-                for char in line_stripped:
-                    if char == '#':
-                        line_heading_level += 1
-                    elif char == ' ':
-                        # Stop counting when we hit a space
-                        break
-                    else:
-                        # Stop if we hit any other character
-                        break
+        before_section = markdown_content[:section_pos]
 
+        # Find the next section at the same level or higher, skipping the section header line
+        end_pos = -1
+        header_line_end = markdown_content.find('\n', section_pos)
+        if header_line_end >= 0:
+            for match in HEADING_LINE_PATTERN.finditer(markdown_content, header_line_end + 1):
                 # If this heading is at the same level or higher, stop here
-                if line_heading_level <= heading_level:
-                    end_index = i
+                if len(match.group(1)) <= heading_level:
+                    end_pos = match.start()
                     break
 
         # Reconstruct the content without the removed section
-        if end_index < len(lines):
+        if end_pos >= 0:
             # There is a section after the removed one
-            cleaned_content = before_section + '\n'.join(lines[end_index:])
+            cleaned_content = before_section + markdown_content[end_pos:]
         else:
             # The removed section was the last section
             cleaned_content = before_section.rstrip()
 
-        # Check if we made changes
-        if cleaned_content != markdown_content:
-            self.logger.debug(f"'{section_header}' section removed")
+        # The header was found, so at least the header line was removed
+        self.logger.debug(f"'{section_header}' section removed")
 
         return cleaned_content
 
@@ -602,38 +618,44 @@ class HtmlProcessor:
             # If there's nothing to remove, return the original content
             return markdown_content
 
-        # Escape potential regex special characters in the lines to remove
-        # and strip whitespace from the config values for robust matching.
-        # Filter out any empty strings resulting from stripping.
-        patterns = [re.escape(line.strip()) for line in lines_to_remove if line.strip()]
-
-        if not patterns:
-            # If lines_to_remove only contained whitespace or was empty after stripping
-            self.logger.debug("No valid non-whitespace patterns provided in lines_to_remove.")
-            return markdown_content
-
-        # Construct the regex pattern:
-        # ^                  - Anchor to the start of a line (due to re.MULTILINE flag).
-        # \s*                - Match optional leading whitespace on the line.
-        # (?:pattern1|...)   - Non-capturing group for all escaped patterns, joined by OR (|).
-        # \s*                - Match optional trailing whitespace on the line.
-        # (?:\r\n|\r|\n)?    - Match an optional universal newline sequence (\r\n, \r, or \n).
-        #                      The '?' makes it optional, correctly handling the last line of the file
-        #                      whether it has a trailing newline or not.
-        combined_pattern = r'^\s*(?:' + '|'.join(patterns) + r')\s*(?:\r\n|\r|\n)?'
+        # The combined pattern only depends on the configured lines, so compile it once per list
+        cache_key = tuple(lines_to_remove)
+        line_pattern = self._line_removal_patterns.get(cache_key)
+        if line_pattern is None:
+            # Escape potential regex special characters in the lines to remove
+            # and strip whitespace from the config values for robust matching.
+            # Filter out any empty strings resulting from stripping.
+            patterns = [re.escape(line.strip()) for line in lines_to_remove if line.strip()]
+
+            if not patterns:
+                # If lines_to_remove only contained whitespace or was empty after stripping
+                self.logger.debug("No valid non-whitespace patterns provided in lines_to_remove.")
+                return markdown_content
+
+            # Construct the regex pattern:
+            # ^                  - Anchor to the start of a line (due to re.MULTILINE flag).
+            # \s*                - Match optional leading whitespace on the line.
+            # (?:pattern1|...)   - Non-capturing group for all escaped patterns, joined by OR (|).
+            # \s*                - Match optional trailing whitespace on the line.
+            # (?:\r\n|\r|\n)?    - Match an optional universal newline sequence (\r\n, \r, or \n).
+            #                      The '?' makes it optional, correctly handling the last line of the file
+            #                      whether it has a trailing newline or not.
+            combined_pattern = r'^\s*(?:' + '|'.join(patterns) + r')\s*(?:\r\n|\r|\n)?'
+
+            # The re.MULTILINE flag ensures '^' matches the start of each line.
+            try:
+                line_pattern = re.compile(combined_pattern, re.MULTILINE)
+            except re.error as e:
+                self.logger.error(f"Regex error during line removal: {e} with pattern: {combined_pattern}")
+                # Return original content if regex fails to prevent data loss
+                return markdown_content
+            self._line_removal_patterns[cache_key] = line_pattern
 
         # Store original length for comparison later
         original_length = len(markdown_content)
 
-        # Perform the substitution using re.sub.
-        # The re.MULTILINE flag ensures '^' matches the start of each line.
         # We replace the entire matched pattern (line + optional newline) with an empty string.
-        try:
-            cleaned_content = re.sub(combined_pattern, '', markdown_content, flags=re.MULTILINE)
-        except re.error as e:
-            self.logger.error(f"Regex error during line removal: {e} with pattern: {combined_pattern}")
-            # Return original content if regex fails to prevent data loss
-            return markdown_content
+        cleaned_content = line_pattern.sub('', markdown_content)
 
         # Log if changes were made
         if len(cleaned_content) < original_length:
@@ -746,34 +768,78 @@ class HtmlProcessor:
         """
         self.logger.debug("Removing 'Created by' line from markdown content")
 
-        # Pattern to match lines starting with 'Created by' (with one or more spaces) and containing date information
-        created_by_pattern = r'Created by\s+.*(?:on|last modified).*\d+.*'
+        # Common case: '\n' is the only line break, so search the text directly instead of splitting it
+        if not SPECIAL_LINE_BREAKS_PATTERN.search(markdown_content):
+            return self._remove_created_by_in_text(markdown_content, return_line)
 
         created_by_line = ""
         lines = markdown_content.splitlines()
-        i = 0
 
         # Find the 'Created by' line
-        while i < len(lines):
-            if re.match(created_by_pattern, lines[i]):
+        for i, line in enumerate(lines):
+            # Cheap literal prefix check before running the regex
+            if line.startswith('Created by') and CREATED_BY_PATTERN.match(line):
                 if return_line:
-                    created_by_line = lines[i]
-
-                # Remove the line
-                lines.pop(i)
+                    created_by_line = line
 
-                # Also remove any blank line that follows the 'Created by' line
-                if i < len(lines) and lines[i].strip() == "":
-                    lines.pop(i)
+                # Remove the line and any blank line that follows it with a single slice deletion
+                end = i + 1
+                if end < len(lines) and lines[end].strip() == "":
+                    end += 1
+                del lines[i:end]
 
                 break  # Exit loop after finding the first match
-            i += 1
 
         # Reconstruct the cleaned content
         cleaned_content = '\n'.join(lines)
 
         return cleaned_content, created_by_line
 
+    def _remove_created_by_in_text(self, markdown_content: str, return_line: bool) -> tuple[str, str]:
+        """
+        Same result as the line based path of _remove_created_by for content whose only line break is '\n',
+        using a single regex search and slicing instead of a split/join round trip.
+        """
+        # '\n'.join(content.splitlines()) drops one trailing newline
+        text = markdown_content[:-1] if markdown_content.endswith('\n') else markdown_content
+
+        match = CREATED_BY_LINE_PATTERN.search(text)
+        if not match:
+            return text, ""
+
+        start = match.start()
+        line_end = text.find('\n', start)
+        if line_end < 0:
+            line_end = len(text)
+        created_by_line = text[start:line_end] if return_line else ""
+
+        # Also remove the following line if it is blank
+        stop = line_end
+        if line_end < len(text):
+            next_end = text.find('\n', line_end + 1)
+            if next_end < 0:
+                next_end = len(text)
+            if text[line_end + 1:next_end].strip() == "":
+                stop = next_end
+
+        if stop < len(text):
+            # Skip the line break that terminates the removed lines
+            cleaned_content = text[:start] + text[stop + 1:]
+        else:
+            # The removed lines were the last ones, so drop the line break before them
+            cleaned_content = text[:max(start - 1, 0)]
+
+        return cleaned_content, created_by_line
+
+    def _fill_yaml_header(self, yaml_header: str, author: str, date_created: str, parent_folder: str) -> str:
+        """Replace the author, dateCreated and up field placeholders of a YAML header template in one pass"""
+        values = {
+            'author: [username]': f'author: {author}',
+            'dateCreated: [date_created]': f'dateCreated: {date_created}',
+            '[[up_field]]': f'[[{parent_folder}]]',
+        }
+        return YAML_PLACEHOLDER_PATTERN.sub(lambda match: values[match.group(0)], yaml_header)
+
     def _insert_yaml_header_md(self, markdown_content: str, page_id: str, link_checker: LinkChecker) -> str:
         """
         Insert a YAML header at the beginning of the markdown content with information
@@ -813,7 +879,7 @@ class HtmlProcessor:
 
                 # Get creation date
                 if page_info.get("creationDate"):
-                    date_match = re.match(r'(\d{4})-(\d{2})-(\d{2})', page_info["creationDate"])
+                    date_match = ISO_DATE_PATTERN.match(page_info["creationDate"])
                     if date_match:
                         year, month, day = date_match.groups()
                         date_created = f"{year}-{month}-{day}"
@@ -828,9 +894,7 @@ class HtmlProcessor:
             self.logger.debug(f"Could not find page info: {parent_folder}")
         
         # Replace placeholders in the YAML header
-        yaml_header = yaml_header.replace('author: [username]', f'author: {author}')
-        yaml_header = yaml_header.replace('dateCreated: [date_created]', f'dateCreated: {date_created}')
-        yaml_header = yaml_header.replace('[[up_field]]', f'[[{parent_folder}]]')
+        yaml_header = self._fill_yaml_header(yaml_header, author, date_created, parent_folder)
         
         # Get tags for this page
         if page_id:
@@ -902,7 +966,7 @@ class HtmlProcessor:
 
                     # Get creation date
                     if space_info.get("creationDate"):
-                        date_match = re.match(r'(\d{4})-(\d{2})-(\d{2})', space_info["creationDate"])
+                        date_match = ISO_DATE_PATTERN.match(space_info["creationDate"])
                         if date_match:
                             year, month, day = date_match.groups()
                             date_created = f"{year}-{month}-{day}"
@@ -928,9 +992,7 @@ class HtmlProcessor:
                 self.logger.debug(f"Could not extract date from Space Details for ID: {page_id}. Using default: {default_date_created}")
 
         # Replace placeholders in the YAML header
-        yaml_header = yaml_header.replace('author: [username]', f'author: {author}')
-        yaml_header = yaml_header.replace('dateCreated: [date_created]', f'dateCreated: {date_created}')
-        yaml_header = yaml_header.replace('[[up_field]]', f'[[{parent_folder}]]')
+        yaml_header = self._fill_yaml_header(yaml_header, author, date_created, parent_folder)
 
         # Get tags for this page (index pages typically shouldn't have content-by-label tags)
         if page_id:
@@ -950,12 +1012,11 @@ class HtmlProcessor:
         updated_content = yaml_header + '\n\n' + markdown_content
         return updated_content
 
-    def _insert_yaml_header_md_blogpost(self, markdown_content: str, blog_post: dict, link_checker: LinkChecker) -> str:
+    def _build_yaml_header_md_blogpost(self, blog_post: dict, link_checker: LinkChecker) -> str:
         """
-        Insert a YAML header at the beginning of blog post markdown content with information
-        extracted from XML data or other metadata.
+        Build the YAML header (including the blank line separating it from the content)
+        for a blog post with information extracted from XML data or other metadata.
         Args:
-            markdown_content: The original markdown content
             blog_post: The blog post dictionary containing metadata
             link_checker: LinkChecker instance for XML access
         """
@@ -969,7 +1030,7 @@ class HtmlProcessor:
         # Get creation date
         date_created = "1900-12-31"
         if blog_post.get("creationDate"):
-            date_match = re.match(r'(\d{4})-(\d{2})-(\d{2})', blog_post["creationDate"])
+            date_match = ISO_DATE_PATTERN.match(blog_post["creationDate"])
             if date_match:
                 year, month, day = date_match.groups()
                 date_created = f"{year}-{month}-{day}"
@@ -985,10 +1046,7 @@ class HtmlProcessor:
         self.logger.debug(f"Parent folder determined as: {parent_folder}")
         
         # Create YAML header
-        yaml_header = self.config.YAML_HEADER_BLOG
-        yaml_header = yaml_header.replace('author: [username]', f'author: {author}')
-        yaml_header = yaml_header.replace('dateCreated: [date_created]', f'dateCreated: {date_created}')
-        yaml_header = yaml_header.replace('[[up_field]]', f'[[{parent_folder}]]')
+        yaml_header = self._fill_yaml_header(self.config.YAML_HEADER_BLOG, author, date_created, parent_folder)
 
         # Get tags for this page
         if blog_post.get("id"):
@@ -1004,11 +1062,8 @@ class HtmlProcessor:
             # Keep the empty tags section as is for consistency
             self.logger.debug("No tags found - keeping empty tags section")
             
-        # Combine YAML header and Markdown content
-        markdown_content = yaml_header + "\n\n" + markdown_content
-
         # return results
-        return markdown_content
+        return yaml_header + "\n\n"
 
     def _extract_space_metadata(self, markdown_content: str) -> tuple[str, str]:
         """
@@ -1023,48 +1078,49 @@ class HtmlProcessor:
         space_header = self.config.SPACE_DETAILS_SECTION
 
         # Look for the Space Details header
-        if space_header not in markdown_content:
+        header_pos = markdown_content.find(space_header)
+        if header_pos < 0:
             self.logger.debug("Space Details header not found")
             return None, None, None
 
-        # Define regex patterns for different metadata fields
-        name_pattern = re.compile(r'Name\s*\|\s*([^\n|]+)', re.MULTILINE)
-        creator_pattern = re.compile(r'Created by\s*\|\s*([^\n|]+)', re.MULTILINE)
+        # Scan the table rows of the section once, keeping the first 'Name' and 'Created by' values
+        section_end = self._find_space_details_end(markdown_content, header_pos)
+        if section_end < 0:
+            section_end = len(markdown_content)
+        rows = {}
+        for row_match in SPACE_DETAILS_ROW_PATTERN.finditer(markdown_content, header_pos, section_end):
+            rows.setdefault(row_match.group(1), row_match.group(2))
+            if len(rows) == 2:
+                break
 
         # Extract space name
-        name_match = name_pattern.search(markdown_content)
-        if name_match:
-            space_name = name_match.group(1).strip()
+        if 'Name' in rows:
+            space_name = rows['Name'].strip()
             self.logger.debug(f"Found space name: {space_name}")
 
         # Extract creator information
-        creator_match = creator_pattern.search(markdown_content)
-        if creator_match:
-            creator_text = creator_match.group(1).strip()
+        if 'Created by' in rows:
+            creator_text = rows['Created by'].strip()
 
             # Extract author name (before parentheses)
-            if '(' in creator_text:
-                author = creator_text.split('(')[0].strip()
-            else:
-                author = creator_text
+            author = creator_text.partition('(')[0].strip()
             self.logger.debug(f"Found space creator: {author}")
 
             # Extract date
-            date_match = re.search(r'\(([^)]+)\)', creator_text)
+            date_match = PARENTHESES_PATTERN.search(creator_text)
             if date_match:
                 date_text = date_match.group(1).strip()
 
                 # Handle various date formats
                 # Format: "Feb. 03, 2017"
-                month_abbr_pattern = re.compile(r'(\w+)\.?\s+(\d{1,2}),\s+(\d{4})')
-                month_abbr_match = month_abbr_pattern.search(date_text)
+                month_abbr_match = MONTH_DATE_PATTERN.search(date_text)
 
                 if month_abbr_match:
                     month_name = month_abbr_match.group(1)
                     day = month_abbr_match.group(2).zfill(2)  # Pad with leading zero if needed
                     year = month_abbr_match.group(3)
-        
-                if month_name in MONTH_PATTERNS:
+
+                    if month_name in MONTH_PATTERNS:
                         month = MONTH_PATTERNS[month_name]
                         date_created = f"{year}-{month}-{day}"
                         self.logger.debug(f"Found space creation date: {date_created}")
@@ -1151,7 +1207,11 @@ class HtmlProcessor:
 
     def _extract_tags_from_content_by_label_sections(self, html_content: str, link_checker: LinkChecker) -> None:
         """Extract tags from content-by-label sections, map them to target pages, and remove the sections."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Most pages have no label lists, skip parsing them
+        if 'content-by-label' not in html_content:
+            return
+
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=CONTENT_BY_LABEL_STRAINER)
 
         # Find content-by-label section
         content_by_label_sections = soup.find_all('ul', class_='content-by-label')
@@ -1194,35 +1254,36 @@ class HtmlProcessor:
         """Remove content-by-label sections from HTML content."""
 
         soup = BeautifulSoup(html_content, 'html.parser')
-
-        # Remove all content-by-label sections
-        content_by_label_sections = soup.find_all('ul', class_='content-by-label')
-        for section in content_by_label_sections:
-            section.decompose()
+        self._remove_content_by_label_sections_in_soup(soup)
         
         # Return as string
         return str(soup)
+
+    def _remove_content_by_label_sections_in_soup(self, soup: BeautifulSoup) -> None:
+        """Remove content-by-label sections from a parsed document in place."""
+
+        # Remove all content-by-label sections
+        for section in soup.find_all('ul', class_='content-by-label'):
+            parent = section.parent
+            section.decompose()
+            # Merge the text around the removed section, as re-parsing the HTML would
+            parent.smooth()
     
-    def _preprocess_blog_posts_in_current_page(self, html_content: str, page_path: str) -> str:      
+    def _preprocess_blog_posts_in_current_page(self, soup: BeautifulSoup, page_path: str) -> None:      
         """
         Find blog posts in the current page, extract their tags, and replace with embedded links.
         
         Args:
-            html_content: HTML content of the current page
+            soup: Parsed HTML of the current page, modified in place
             page_path: Path to the current HTML file being processed
-            
-        Returns:
-            Modified HTML content with blog posts replaced by embedded links
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-
         try:            
             # Find all blog-post-listing divs
             blog_listings = soup.find_all('div', class_='blog-post-listing')
             
             if not blog_listings:
-                # No blog posts in this page, return original content as string
-                return str(soup)
+                # No blog posts in this page
+                return
             
             self.logger.info(f"Found {len(blog_listings)} blog post(s) in {page_path}")
             
@@ -1247,14 +1308,28 @@ class HtmlProcessor:
                     new_div.append(BeautifulSoup(embedded_link_html, 'html.parser'))
                     listing.replace_with(new_div)
             
-            # Return as string
-            return str(soup)
-            
         except Exception as e:
             self.logger.error(f"Error preprocessing blog posts in page {page_path}: {e}")
-            # Return as string
-            return str(soup)
     
+    def _collect_blog_post_tags(self, page_path: str) -> None:
+        """
+        Extract the tags of the blog posts listed in a page without converting it (for pages skipped by INCREMENTAL).
+
+        Args:
+            page_path: Path to the HTML file of the page
+        """
+        html_content = read_text_file(page_path)
+
+        # Most pages list no blog posts, skip parsing them
+        if 'blog-post-listing' not in html_content:
+            return
+
+        soup = BeautifulSoup(html_content, 'html.parser', parse_only=BLOG_LISTING_STRAINER)
+        for listing in soup.find_all('div', class_='blog-post-listing'):
+            blog_info = self._extract_blog_info_from_listing(listing, page_path)
+            if blog_info:
+                self.blog_post_tags[blog_info['page_id']] = blog_info['tags']
+
     def _extract_blog_info_from_listing(self, listing_div: BeautifulSoup, page_path: str) -> Optional[Dict[str, Any]]:
         """
         Extract blog post information from a blog-post-listing div.
@@ -1391,8 +1466,8 @@ class HtmlProcessor:
         
     def _is_special_folder(self, path: str) -> bool:
         """Check if a path contains any special folder names"""
-        special_folders = [self.config.ATTACHMENTS_PATH, self.config.IMAGES_PATH, self.config.STYLES_PATH]
-        return any(folder in path.split(os.sep) for folder in special_folders)
+        special_folders = {self.config.ATTACHMENTS_PATH, self.config.IMAGES_PATH, self.config.STYLES_PATH}
+        return not special_folders.isdisjoint(path.split(os.sep))
 
     def _get_special_folder_type(self, path: str) -> str:
         """Determine which type of special folder this is"""
@@ -1405,6 +1480,23 @@ class HtmlProcessor:
             return "images"
         return None
 
+    def _is_output_up_to_date(self, html_file: str, output_dir: str, page_id: Optional[str], link_checker: LinkChecker) -> bool:
+        """Check if the markdown output of a page already exists and is newer than its HTML source, remembering skipped outputs"""
+        page_title = link_checker.attachment_processor.xml_processor.get_page_title_by_id(page_id) if page_id else None
+        if not page_title:
+            return False
+
+        final_out_path = os.path.join(output_dir, f"{page_title}.md")
+        try:
+            up_to_date = os.stat(final_out_path).st_mtime >= os.stat(html_file).st_mtime
+        except FileNotFoundError:
+            return False
+
+        # The crosslink pass must not rewrite these a second time (see _fix_md_crosslinks)
+        if up_to_date:
+            self.skipped_outputs.add(os.path.normpath(final_out_path))
+        return up_to_date
+
     def _append_comments_to_page(self, markdown_content: str, page_info: dict) -> str:
         """Append comments to the page's markdown content, converting HTML to Markdown"""
         if not page_info or not page_info.get("comments"):
@@ -1489,17 +1581,22 @@ class HtmlProcessor:
         # URL decode the filename
         filename = unquote(filename)
 
-        # Normalize Unicode characters
-        filename = unicodedata.normalize('NFKC', filename)
+        # Normalize Unicode characters (ASCII text is already normalized)
+        if not filename.isascii():
+            filename = unicodedata.normalize('NFKC', filename)
 
-        # Filter bad/invisible characters, apply URL decoding
-        filename = ''.join(c for c in filename if self.is_valid_char(c))
+        # Filter bad/invisible characters, checking each distinct character only once per run
+        table = self._valid_char_table
+        for c in set(filename):
+            if ord(c) not in table:
+                table[ord(c)] = ord(c) if self.is_valid_char(c) else None
+        filename = filename.translate(table)
         
         # Trim leading/trailing periods and spaces
         filename = filename.strip('. ')
 
         # Replace remaining problematic characters with dashes
-        filename = re.sub(INVALID_CHARS, '-', filename)
+        filename = filename.translate(INVALID_CHARS_TABLE)
 
         # Handle spaces according to configuration
         if self.config.USE_UNDERSCORE_IN_FILENAMES:
@@ -1622,23 +1719,36 @@ class HtmlProcessor:
                 self.logger.debug("Skipping original 'index.html' file. Index will be replaced by actual Homepage.")
                 return True
 
-            # Read HTML content
-            with open(html_file, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            # Extract page ID using the XML processor (the output directory is shared by the whole space)
+            page_id = link_checker.attachment_processor.xml_processor.get_page_id_by_filename(filename, md_output_name)
+            output_dir = os.path.dirname(md_output_name)
+
+            # Skip pages whose output is newer than the source (incremental re-runs)
+            if self.config.INCREMENTAL and self._is_output_up_to_date(html_file, output_dir, page_id, link_checker):
+                self.logger.info(f"Skipping unchanged file: {html_file}")
+                # The blog posts listed here are converted again and need their tags
+                self._collect_blog_post_tags(html_file)
+                return True
+
+            # Read the HTML and parse it once for all preprocessing steps
+            # (html.parser, not lxml: the two repair malformed markup differently and that would change the output)
+            html_content = read_text_file(html_file)
             self.logger.debug(f"HTML file size: {len(html_content)} bytes")
+            soup = BeautifulSoup(html_content, 'html.parser')
 
             # Remove content-by-label sections (tags already extracted during mapping phase)
-            html_content = self._remove_content_by_label_sections(html_content)
+            self._remove_content_by_label_sections_in_soup(soup)
 
             # Preprocess blog posts in this page (extract tags and replace with embedded links)
-            html_content = self._preprocess_blog_posts_in_current_page(html_content, html_file)
+            self._preprocess_blog_posts_in_current_page(soup, html_file)
 
             # Convert HTML to Markdown
             try:
                 self.logger.debug("Converting HTML to Markdown")
                     
-                # Apply content-preserving preprocessing to fix tables
-                html_content = self._preprocess_tables(html_content)
+                # Apply content-preserving preprocessing to fix tables, then serialize once
+                self._preprocess_tables(soup)
+                html_content = str(soup)
 
                 # Convert to MD
                 markdown_content = self._convert_html_to_markdown(html_content)
@@ -1651,9 +1761,6 @@ class HtmlProcessor:
                 self.logger.error(f"Failed to convert {filename}: {str(e)}")
                 return False
 
-            # Extract page ID using the XML processor
-            page_id = link_checker.attachment_processor.xml_processor.get_page_id_by_filename(filename, md_output_name)
-
             if page_id:
                 page_info = link_checker.attachment_processor.xml_processor.get_page_by_id(page_id)
 
@@ -1662,7 +1769,7 @@ class HtmlProcessor:
                 markdown_content = self._append_comments_to_page(markdown_content, page_info)
 
             # Check if it's the new index file
-            space_key = os.path.basename(os.path.dirname(md_output_name))
+            space_key = os.path.basename(output_dir)
             space_info = link_checker.attachment_processor.xml_processor.get_space_by_key(space_key)
             homePageId = space_info["homePageId"]
             is_new_index = homePageId == page_id
@@ -1735,17 +1842,10 @@ class HtmlProcessor:
             self.logger.debug(f"Saving page id '{page_id}' as filename: '{final_md_output_name}'")
 
             # Ensure the directory exists
-            base_dir = os.path.dirname(md_output_name)
-            final_out_path = os.path.join(base_dir, final_md_output_name)
-            os.makedirs(os.path.dirname(final_out_path), exist_ok=True)
-
-            with open(final_out_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            final_out_path = os.path.join(output_dir, final_md_output_name)
+            os.makedirs(output_dir, exist_ok=True)
 
-            if not os.path.exists(final_out_path):
-                raise FileNotFoundError(f"Output file not created: {final_out_path}")
-
-            output_size = os.path.getsize(final_out_path)
+            output_size = write_text_file(final_out_path, markdown_content)
             self.logger.info(f"Conversion successful. Output file size: {output_size} bytes")
             return True
 
@@ -1754,44 +1854,95 @@ class HtmlProcessor:
             self.logger.debug(f"Error details: {str(e)}")
             return False
 
-    def create_tag_mapping_from_html(self, input_folders: list, link_checker: LinkChecker) -> None:
+    def create_tag_mapping_from_html(self, html_manifest: list, link_checker: LinkChecker) -> None:
         """Create tag mapping by scanning all HTML files for content-by-label sections."""
         self.logger.info("Creating tag mapping from HTML content-by-label sections...")
-                
-        for input_folder in input_folders:
-            for root, _, files in os.walk(input_folder):
-                # Skip special folders
-                if self._is_special_folder(root):
-                    continue
-                    
-                html_files = [f for f in files if f.endswith('.html')]
-                
-                for filename in html_files:
-                    html_file = os.path.join(root, filename)
-                    
+
+        html_paths = [os.path.join(root, filename) for _, root, html_files in html_manifest for filename in html_files]
+
+        # Read files in batches on a thread pool so the reads overlap, then parse them here in order
+        with ThreadPoolExecutor(max_workers=self.config.MAX_WORKERS or None) as executor:
+            for start in range(0, len(html_paths), READ_BATCH_SIZE):
+                batch = html_paths[start:start + READ_BATCH_SIZE]
+                for html_file, html_content in zip(batch, executor.map(self._read_html_for_tag_mapping, batch)):
+                    if html_content is None:
+                        continue
+
                     try:
-                        with open(html_file, 'r', encoding='utf-8') as f:
-                            html_content = f.read()
-                        
                         # Extract tags and map them to target pages
                         self._extract_tags_from_content_by_label_sections(html_content, link_checker)
-                        
+
                     except Exception as e:
                         self.logger.error(f"Error processing {html_file} for tag mapping: {e}")
         
         self.logger.info(f"Tag mapping created with {len(self.page_tag_mapping)} target pages")
 
-    def count_html_files(self, input_folders: list) -> int:
-        """Count HTML files excluding special folders"""
-        total_count = 0
+    def _read_html_for_tag_mapping(self, html_file: str) -> Optional[str]:
+        """Read an HTML file for the tag mapping pass, returns None if it cannot be read"""
+        try:
+            with open(html_file, 'r', encoding='utf-8') as f:
+                return f.read()
+        except Exception as e:
+            self.logger.error(f"Error processing {html_file} for tag mapping: {e}")
+            return None
+
+    def scan_html_files(self, input_folders: list) -> List[Tuple[str, str, List[str]]]:
+        """
+        Scan the input folders once with os.scandir, skipping special folders.
+
+        Args:
+            input_folders: List of input folder paths
+
+        Returns:
+            List of (input_folder, directory, html_filenames) tuples in os.walk (top-down) order
+        """
+        special_folders = {self.config.ATTACHMENTS_PATH, self.config.IMAGES_PATH, self.config.STYLES_PATH}
+        html_manifest = []
+
         for input_folder in input_folders:
-            for root, _, files in os.walk(input_folder):
-                # Skip special folders when counting
-                if self._is_special_folder(root):
+            if self._is_special_folder(input_folder):
+                continue
+
+            pending = [input_folder]
+            while pending:
+                root = pending.pop()
+                html_files = []
+                subfolders = []
+                try:
+                    with os.scandir(root) as entries:
+                        for entry in entries:
+                            # DirEntry caches the file type from the directory listing (no extra stat)
+                            if entry.is_dir():
+                                if entry.name not in special_folders and not entry.is_symlink():
+                                    subfolders.append(entry.path)
+                            elif entry.name.endswith('.html'):
+                                html_files.append(entry.name)
+                except OSError as e:
+                    self.logger.error(f"Error scanning directory {root}: {e}")
                     continue
 
-                # Count HTML files in this directory
-                html_files = [f for f in files if f.endswith('.html')]
-                total_count += len(html_files)
+                html_manifest.append((input_folder, root, html_files))
+                # Visit subfolders next, in listing order
+                pending.extend(reversed(subfolders))
+
+        return html_manifest
+
+    def list_space_folders(self, input_folders: list) -> List[str]:
+        """
+        List the top-level subfolders of the input folders once, in directory listing order.
 
-        return total_count
+        Args:
+            input_folders: List of input folder paths
+
+        Returns:
+            List of subfolder names (as returned by os.walk)
+        """
+        space_folders = []
+        for input_folder in input_folders:
+            with os.scandir(input_folder) as entries:
+                space_folders.extend(entry.name for entry in entries if entry.is_dir())
+        return space_folders
+
+    def count_html_files(self, html_manifest: list) -> int:
+        """Count HTML files excluding special folders"""
+        return sum(len(html_files) for _, _, html_files in html_manifest)
@@ -1,20 +1,59 @@
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import re
 import logging
+import json
+import time
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Set, Tuple, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from config import Config
 from attachmentprocessor import AttachmentProcessor
 
+# Use the faster lxml parser if it is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 # CONSTANTS REGEX (DO NOT CHANGE)
 FILENAME_PATTERN = re.compile(r'^(.+)_(\d+)(\.md)$')
 UNDERSCORE_DIGITS_PATTERN = re.compile(r'_\d+$')
 LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(<?([^>)]+)>?\)')
 URL_PATTERN = re.compile(r'\[([^\]]+)\]\((https?://[^)]+)\)')
+DOWNLOAD_PREFIX_PATTERN = re.compile(r'^(/?)download/')  # Leading "download/" of a source path
+DOWNLOAD_LINK_PATTERN = re.compile(r'download/attachments/(\d+)/([^)&>"\']+)(?:\?[^>)]*)?')  # Download link: page ID, filename
+ATTACHMENT_LINK_PATTERN = re.compile(r'(!?)\[(.*?)\]\((attachments/(\d+)/(\d+)\.[^)]+)\)')  # Direct attachment links: embed marker, description, link, page ID, attachment ID
+ATTACHMENT_ID_PATTERN = re.compile(r'attachments/(\d+)/(\d+)')  # Page ID, attachment ID
+ATTACHMENT_FILENAME_PATTERN = re.compile(r'attachments/(\d+)/([^/]+)$')  # Page ID, attachment filename
+FILENAME_ID_PATTERN = re.compile(r'/(\d+)(?:\.\w+)?$')  # Numeric ID at the end of a path
+SCHEME_HOST_PATTERN = re.compile(r'^.*?://(?:[^/]*/)?', re.DOTALL)  # Up to the first '://' plus the host and its '/'
 URL_TIMEOUT = int(8)  # Timeout for web requests
+URL_CHECK_WORKERS = 16  # Web URLs of a page verified concurrently
+URL_CACHE_FILE_NAME = 'url_cache.json'  # Web URL results kept between runs (in the log folder)
+URL_CACHE_TTL = 7 * 24 * 3600  # Seconds a cached web URL result stays valid
+WEB_URL_SCHEMES = ('http://', 'https://')
+SLASH_TABLE = str.maketrans({'\\': '/'})  # Backslash -> forward slash path normalization
+IMG_STRAINER = SoupStrainer('img')  # Parse only image tags when extracting image sources
+VIDEO_STRAINER = SoupStrainer('video')  # Parse only video tags when processing video links
+VIDEO_TAG_PATTERN = re.compile(r'<video\b', re.IGNORECASE)  # Quick check for any video tag
+
+def _bracket_text(text: str, opening: str, closing: str) -> str:
+    """Text between the first opening and the next closing bracket on the same line, empty if there is none"""
+    for line in text.split('\n'):
+        start = line.find(opening)
+        if start != -1:
+            end = line.find(closing, start + len(opening))
+            if end != -1:
+                return line[start + len(opening):end]
+    return ""
 
 class LinkChecker:
     def __init__(self, config: Config, logger: logging.Logger, attachment_processor: AttachmentProcessor) -> None:
@@ -25,29 +64,56 @@ class LinkChecker:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Keep enough pooled connections for the concurrent URL checks and retry transient server errors
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=frozenset(['HEAD', 'GET']), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=URL_CHECK_WORKERS, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.checked_urls: Set[str] = set()
+        self._checked_urls_lock = threading.Lock()  # Pages verify their URLs concurrently
+        self._url_cache_path = os.path.join(config.LOG_FOLDER, URL_CACHE_FILE_NAME)
+        self._url_cache = self._load_url_cache()  # url -> [is_valid, status, timestamp]
+        self._url_cache_changed = False
+        atexit.register(self._save_url_cache)
+        self._url_executor = ThreadPoolExecutor(max_workers=URL_CHECK_WORKERS)  # Shared pool for web URL checks
         self.input_folder = config.INPUT_FOLDER
         self.input_folder_xml = config.INPUT_FOLDER_XML
         self.output_folder = config.OUTPUT_FOLDER
         self.renamed_files = {}  # Cache for renamed files
         self.filename_mapping = {}  # Cache for renamed files reference
         self.basename_dir_mapping = {}  # Directory-aware mapping for basenames
-        self.file_cache = {}     # Cache for file existence checks
+        self.file_cache = None   # Cache for file existence checks, built on first use by fix_crosslinks
         self.attachment_processor = attachment_processor
-        self._build_file_cache()
+
+        # Internal link templates, resolved once from configuration ({0} = link, {1} = description)
+        if config.USE_WIKI_LINKS:
+            # Escape "|" as "\\|" to avoid broken tables in MD content
+            separator = "\\|" if config.USE_ESCAPING_FOR_WIKI_LINKS else "|"
+            self._link_format = "[[{0}" + separator + "{1}]]"
+            self._link_format_bare = "[[{0}]]"
+        else:
+            self._link_format = "[{1}](<{0}>)"
+            self._link_format_bare = "[{0}](<{0}>)"
+        self._wikilink_cache = {}  # Cache for formatted links
+
+        # Page ID in a local attachment path, e.g. "/attachments/12345/"
+        self._attachment_page_id_pattern = re.compile(rf'/{re.escape(config.ATTACHMENTS_PATH)}/(\d+)/')
 
     def _build_file_cache(self) -> None:
         """Build cache of existing files in input and output directories"""
+        file_cache = {}
         for root, _, files in os.walk(self.output_folder):
             for file in files:
                 full_path = os.path.join(root, file)
                 rel_path = os.path.relpath(full_path, self.output_folder)
-                self.file_cache[rel_path] = full_path
+                file_cache[rel_path] = full_path
+        self.file_cache = file_cache
 
     def extract_image_src(self, html_content: str) -> list:
         """Extract image sources and metadata from HTML content"""
-        # Use BeautifulSoup for more reliable HTML parsing
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Use BeautifulSoup for more reliable HTML parsing, only building the <img> tags
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=IMG_STRAINER)
         images = []
 
         for img in soup.find_all('img'):
@@ -68,20 +134,15 @@ class LinkChecker:
         Check if the URL is a web URL, excluding internal Confluence URLs
         Returns False for internal Confluence URLs, True for other web URLs
         """
-        if url.startswith(self.config.CONFLUENCE_BASE_URL):
-            return False
-        return url.startswith(('http://', 'https://'))
+        # Most links are internal, so test the scheme first and only then exclude the Confluence base URL
+        return url.startswith(WEB_URL_SCHEMES) and not url.startswith(self.config.CONFLUENCE_BASE_URL)
 
     def make_relative_path(self, path: str) -> str:
         """Convert path to relative format"""
         # Remove any leading slashes or directory references
         path = path.lstrip('/')
-        # Remove any base URL parts if present
-        if '://' in path:
-            path = path.split('://', 1)[1]
-            if '/' in path:
-                path = path.split('/', 1)[1]
-        return path
+        # Remove any base URL parts (scheme and host) if present
+        return SCHEME_HOST_PATTERN.sub('', path, count=1)
  
     def verify_local_image(self, src_path: str, current_file_path: str) -> Tuple[str, bool, str]:
         """Verify a local image path"""
@@ -96,7 +157,7 @@ class LinkChecker:
         # Check output folder first (as files should be copied by now)
         output_path = os.path.normpath(os.path.join(self.output_folder, rel_path))
         self.logger.debug(f"Checking output path: {output_path}")
-        if os.path.exists(output_path) and os.path.isfile(output_path):
+        if os.path.isfile(output_path):
             self.logger.debug(f"Image found in output folder: {output_path}")
             return rel_path.replace(os.sep, '/'), True, "Local image exists"
 
@@ -104,13 +165,11 @@ class LinkChecker:
         # The space key might be the first part of current_file_path if it contains directory info
         space_key = None
         if os.sep in current_file_path:
-            parts = current_file_path.split(os.sep)
-            if len(parts) > 1:
-                space_key = parts[0]
-                self.logger.debug(f"Extracted space key from path: {space_key}")
+            space_key = current_file_path.partition(os.sep)[0]
+            self.logger.debug(f"Extracted space key from path: {space_key}")
                 
         # Check if we have a page ID in the src_path
-        page_id_match = re.search(rf'/{self.config.ATTACHMENTS_PATH}/(\d+)/', src_path)
+        page_id_match = self._attachment_page_id_pattern.search(src_path)
         page_id = page_id_match.group(1) if page_id_match else None
         
         # If we have both space_key and page_id, construct a reliable path
@@ -131,10 +190,16 @@ class LinkChecker:
 
     def verify_web_url(self, url: str) -> Tuple[str, bool, str]:
         """Verify a web URL"""
-        if url in self.checked_urls:
-            return url, True, "Already checked"
+        with self._checked_urls_lock:
+            if url in self.checked_urls:
+                return url, True, "Already checked"
+            self.checked_urls.add(url)
+
+        # Reuse a recent result from a previous run
+        cached = self._url_cache.get(url)
+        if cached and time.time() - cached[2] < URL_CACHE_TTL:
+            return url, cached[0], cached[1]
 
-        self.checked_urls.add(url)
         try:
             response = self.session.head(url, timeout=URL_TIMEOUT, allow_redirects=True)
             if response.status_code == 405:  # Method not allowed, try GET
@@ -142,10 +207,37 @@ class LinkChecker:
 
             is_valid = 200 <= response.status_code < 400
             status = f"Status: {response.status_code}"
+            # Only server answers are cached, connection errors are retried on the next run
+            self._url_cache[url] = [is_valid, status, time.time()]
+            self._url_cache_changed = True
             return url, is_valid, status
         except requests.exceptions.RequestException as e:
             return url, False, f"Error: {str(e)}"
 
+    def _load_url_cache(self) -> dict:
+        """Load web URL results of previous runs"""
+        try:
+            with open(self._url_cache_path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable URL cache {self._url_cache_path}: {e}")
+            return {}
+
+    def _save_url_cache(self) -> None:
+        """Write the web URL results for the next run (atomically replaces the cache file)"""
+        if not self._url_cache_changed:
+            return
+        temp_path = self._url_cache_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._url_cache, f)
+            os.replace(temp_path, self._url_cache_path)
+            self._url_cache_changed = False
+        except OSError as e:
+            self.logger.warning(f"Could not write URL cache {self._url_cache_path}: {e}")
+
     def clean_filename(self, md_output: str) -> str:
         """
         Remove numeric suffixes from filename and use proper title from XML if available.
@@ -199,7 +291,7 @@ class LinkChecker:
         else:
             # Check in output directory for attachment folder
             attachment_path = os.path.join(dir_path, self.config.ATTACHMENTS_PATH, number)
-            if not (os.path.exists(attachment_path) and os.path.isdir(attachment_path)):
+            if not os.path.isdir(attachment_path):
                 self.logger.debug(f"No matching attachment folder found for number: {number}")
                 return md_output
             new_filename = f"{base_name}{extension}"
@@ -226,9 +318,16 @@ class LinkChecker:
         """
         self.logger.debug(f"Fixing crosslinks in {current_file_path}")
 
+        # Walk the output folder only when links are actually fixed, not while pages are still being written
+        if self.file_cache is None:
+            self._build_file_cache()
+
         # Get the directory of the current file for context
         current_dir = os.path.dirname(os.path.relpath(current_file_path, self.output_folder))
 
+        # Evaluated once per document: skip building debug messages in the link callback when disabled
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         def process_link(match):
             description = match.group(1)
             link = match.group(2).strip('<>')
@@ -252,20 +351,23 @@ class LinkChecker:
                         # remove URL parameters (everything after '&')
                     if '&' in new_link:
                         new_link = new_link.split('&', 1)[0]
-                    self.logger.debug(f"Link changed to: {new_link}")
+                    if debug:
+                        self.logger.debug(f"Link changed to: {new_link}")
                     break  # Break only if a prefix match was found
 
             # Remove Link
             for prefix in self.config.PREFIXES_TO_REMOVE:
                 base_url_prefix = self.config.CONFLUENCE_BASE_URL + prefix
                 if new_link.startswith(prefix) or new_link.startswith(base_url_prefix):
-                    self.logger.debug(f"Link found for prefix {prefix}, {base_url_prefix} to remove: {new_link}")
+                    if debug:
+                        self.logger.debug(f"Link found for prefix {prefix}, {base_url_prefix} to remove: {new_link}")
                     new_link = ""
                     break  # Break only if a prefix match was found
 
             # Returning empty link if removed
             if new_link == "":
-                self.logger.debug(f"Modified Link: {new_link}")
+                if debug:
+                    self.logger.debug(f"Modified Link: {new_link}")
                 return new_link
 
             # Check if this is a link to index.md or index.html
@@ -279,7 +381,7 @@ class LinkChecker:
                     link_dir = current_dir
 
                 # Construct the full path to check in mappings
-                full_path = os.path.join(link_dir, basename).replace('\\', '/')
+                full_path = os.path.join(link_dir, basename).translate(SLASH_TABLE)
 
                 # Try to find the index file in the same directory
                 if basename in self.basename_dir_mapping:
@@ -291,7 +393,8 @@ class LinkChecker:
                         # Extract just the filename if the link is in the same directory
                         if link_dir == current_dir or not link_dir:
                             new_link = os.path.basename(new_link)
-                        self.logger.debug(f"Found directory-specific mapping for index: {link_dir}/{basename} -> {new_link}")
+                        if debug:
+                            self.logger.debug(f"Found directory-specific mapping for index: {link_dir}/{basename} -> {new_link}")
                         return self.convert_wikilink(description, new_link)
 
                     # If no exact match but we're in the same directory, try current directory
@@ -299,14 +402,16 @@ class LinkChecker:
                         new_link = dir_mappings[current_dir]
                         # Extract just the filename if the link is in the same directory
                         new_link = os.path.basename(new_link)
-                        self.logger.debug(f"Using current directory mapping for index: {current_dir}/{basename} -> {new_link}")
+                        if debug:
+                            self.logger.debug(f"Using current directory mapping for index: {current_dir}/{basename} -> {new_link}")
                         return self.convert_wikilink(description, new_link)
                     
                 # Check if we have a mapping for this specific index file
                 if full_path in self.filename_mapping:
                     #self.logger.debug(f"Found match for full_path: {full_path}")
                     new_link = self.filename_mapping[full_path]
-                    self.logger.debug(f"Replaced index link with directory context: {link} -> {new_link}")
+                    if debug:
+                        self.logger.debug(f"Replaced index link with directory context: {link} -> {new_link}")
                     return self.convert_wikilink(description, new_link)
 
             # Get base filename without extension
@@ -321,7 +426,8 @@ class LinkChecker:
                     new_link = dir_mappings[current_dir]
                     # Extract just the filename if the link is in the same directory
                     new_link = os.path.basename(new_link)
-                    self.logger.debug(f"Found directory-specific mapping: {current_dir}/{base_name} -> {new_link}")
+                    if debug:
+                        self.logger.debug(f"Found directory-specific mapping: {current_dir}/{base_name} -> {new_link}")
                     return self.convert_wikilink(description, new_link)
 
             # Fall back to regular mapping if directory-specific mapping not found
@@ -332,7 +438,8 @@ class LinkChecker:
                 target_dir = os.path.dirname(new_link)
                 if target_dir == current_dir or not target_dir:
                     new_link = os.path.basename(new_link)
-                self.logger.debug(f"Direct mapping found for: {original_link} -> {new_link}")
+                if debug:
+                    self.logger.debug(f"Direct mapping found for: {original_link} -> {new_link}")
                 return self.convert_wikilink(description, new_link)
 
             # Try with .md extension explicitly
@@ -344,7 +451,8 @@ class LinkChecker:
                 target_dir = os.path.dirname(new_link)
                 if target_dir == current_dir or not target_dir:
                     new_link = os.path.basename(new_link)
-                self.logger.debug(f"MD mapping found for: {original_link} -> {new_link}")
+                if debug:
+                    self.logger.debug(f"MD mapping found for: {original_link} -> {new_link}")
                 return self.convert_wikilink(description, new_link)
 
             # Try with .html extension explicitly
@@ -356,7 +464,8 @@ class LinkChecker:
                 target_dir = os.path.dirname(new_link)
                 if target_dir == current_dir or not target_dir:
                     new_link = os.path.basename(new_link)
-                self.logger.debug(f"HTML mapping found for: {original_link} -> {new_link}")
+                if debug:
+                    self.logger.debug(f"HTML mapping found for: {original_link} -> {new_link}")
                 return self.convert_wikilink(description, new_link)
 
             # Try with just the base name (no extension)
@@ -367,35 +476,43 @@ class LinkChecker:
                 target_dir = os.path.dirname(new_link)
                 if target_dir == current_dir or not target_dir:
                     new_link = os.path.basename(new_link)
-                self.logger.debug(f"Base name mapping found for: {original_link} -> {new_link}")
+                if debug:
+                    self.logger.debug(f"Base name mapping found for: {original_link} -> {new_link}")
                 return self.convert_wikilink(description, new_link)
             
             # If we get here, no mapping was found
-            self.logger.debug(f"No mapping found for link: {original_link}")
+            if debug:
+                self.logger.debug(f"No mapping found for link: {original_link}")
             
             # Keep page IDs unchanged but ensure they have .md extension
             if base_name.isdigit():
-                self.logger.debug(f"Numeric link found: {base_name}")
+                if debug:
+                    self.logger.debug(f"Numeric link found: {base_name}")
                 if f"{base_name}.md" in self.filename_mapping:
-                    self.logger.debug(f"Found match for base_name: {base_name}")
+                    if debug:
+                        self.logger.debug(f"Found match for base_name: {base_name}")
                     new_link = self.filename_mapping[f"{base_name}.md"]
                     # Check if the target is in the same directory
                     target_dir = os.path.dirname(new_link)
                     if target_dir == current_dir or not target_dir:
                         new_link = os.path.basename(new_link)
-                    self.logger.debug(f"Found mapping for numeric ID: {base_name}.md -> {new_link}")
+                    if debug:
+                        self.logger.debug(f"Found mapping for numeric ID: {base_name}.md -> {new_link}")
                     return self.convert_wikilink(description, new_link)
                 elif f"{base_name}.html" in self.filename_mapping:
-                    self.logger.debug(f"Found match for {base_name}.html: {base_name}.html")
+                    if debug:
+                        self.logger.debug(f"Found match for {base_name}.html: {base_name}.html")
                     new_link = self.filename_mapping[f"{base_name}.html"]
                     # Check if the target is in the same directory
                     target_dir = os.path.dirname(new_link)
                     if target_dir == current_dir or not target_dir:
                         new_link = os.path.basename(new_link)
-                    self.logger.debug(f"Found mapping for numeric ID: {base_name}.html -> {new_link}")
+                    if debug:
+                        self.logger.debug(f"Found mapping for numeric ID: {base_name}.html -> {new_link}")
                     return self.convert_wikilink(description, new_link)
                 else:
-                    self.logger.debug(f"No mapping found for numeric ID: {base_name}")
+                    if debug:
+                        self.logger.debug(f"No mapping found for numeric ID: {base_name}")
                     base_name = base_name + ".md"
                     return self.convert_wikilink(description, base_name)
 
@@ -409,7 +526,8 @@ class LinkChecker:
                 # Use just the filename for same-directory links
                 return self.convert_wikilink(description, os.path.basename(potential_path))
 
-            self.logger.debug(f"Using default link format for: {original_link} -> {base_name}.md")
+            if debug:
+                self.logger.debug(f"Using default link format for: {original_link} -> {base_name}.md")
             base_name = base_name + ".md"
             return self.convert_wikilink(description, base_name)
 
@@ -428,6 +546,16 @@ class LinkChecker:
         Returns:
         Formatted link in wiki or markdown format
         """
+        # The result only depends on the arguments and the configuration, so memoize it
+        key = (description, link, is_embedded)
+        formatted = self._wikilink_cache.get(key)
+        if formatted is None:
+            formatted = self._format_link(description, link, is_embedded)
+            self._wikilink_cache[key] = formatted
+        return formatted
+
+    def _format_link(self, description: Optional[str], link: str, is_embedded: bool) -> str:
+        """Format a link for convert_wikilink (uncached)"""
         if link.startswith(("http://", "https://", "ftp://")):
             # Keep external links in standard markdown format
             if is_embedded:
@@ -445,7 +573,7 @@ class LinkChecker:
             
             # URL encode only spaces (leave other characters untouched)
             path_part = path_part.replace(" ", "%20")
-            path_part = path_part.replace("\\", "/")  # Replace all backslashes with forward slashes
+            path_part = path_part.translate(SLASH_TABLE)  # Replace all backslashes with forward slashes
 
             # Prepend double backslash to UNC Path if config allows
             if self.config.FILESERVER_REPLACEMENT_ENABLED and path_part.startswith(self.config.FILESERVER_INDICATOR):
@@ -464,43 +592,11 @@ class LinkChecker:
                 return f"[{path_part}]({normalized_link})"
 
         # Handle internal links based on configuration
-        if self.config.USE_WIKI_LINKS:
-            # Return Wikilink Link
-            if self.config.USE_ESCAPING_FOR_WIKI_LINKS:
-                # Escape "|" as "\\|" to avoid broken tables in MD content
-                if description:
-                    if is_embedded:
-                        return f"![[{link}\\|{description}]]"
-                    else:
-                        return f"[[{link}\\|{description}]]"
-                else:
-                    if is_embedded:
-                        return f"![[{link}]]"
-                    else:
-                        return f"[[{link}]]"
-            else:
-                if description:
-                    if is_embedded:
-                        return f"![[{link}|{description}]]"
-                    else:
-                        return f"[[{link}|{description}]]"
-                else:
-                    if is_embedded:
-                        return f"![[{link}]]"
-                    else:
-                        return f"[[{link}]]"
-        else:
-            # Return regular MD Link with angle brackets for internal links
-            if description:
-                if is_embedded:
-                    return f"![{description}](<{link}>)"
-                else:
-                    return f"[{description}](<{link}>)"
-            else:
-                if is_embedded:
-                    return f"![{link}](<{link}>)"
-                else:
-                    return f"[{link}](<{link}>"
+        link_format = self._link_format if description else self._link_format_bare
+        formatted = link_format.format(link, description)
+        if is_embedded:
+            formatted = "!" + formatted
+        return formatted
 
     def find_and_rename_attachments(self, page_id: str) -> dict:
         """
@@ -578,8 +674,9 @@ class LinkChecker:
         Returns:
         Updated markdown content with processed links
         """
-        # Extract and verify image sources from HTML
+        # Extract image sources from HTML and link web images (independent of the verification result)
         image_sources = self.extract_image_src(html_content)
+        web_images = []
         for img in image_sources:
             src = img['src']
             description = img['description']
@@ -590,29 +687,41 @@ class LinkChecker:
                 continue
 
             if self.is_web_url(src):
-                url, is_valid, status = self.verify_web_url(src)
-                if not is_valid:
-                    self.logger.warning(f"Image verification failed but keeping link: {url} - {status}")
+                web_images.append(src)
 
-                # Create the correct markdown image link regardless of validity, but only if URL is not empty
-                if url:
-                    new_link = self.convert_wikilink(description, url, is_embedded=True)
+                # Create the correct markdown image link regardless of validity
+                # (the pattern needs the literal "(<src>)", so skip the regex scan when it is absent,
+                # e.g. for repeated images already replaced by wikilinks)
+                if f'(<{src}>)' in markdown_content:
+                    new_link = self.convert_wikilink(description, src, is_embedded=True)
                     old_pattern = f'\\[.*?\\]\\(<{re.escape(src)}>\\)(?: \\[BROKEN IMAGE\\])?(?: \\(image/[^)]+\\))?'
                     markdown_content = re.sub(old_pattern, new_link, markdown_content)
-                else:
-                    self.logger.warning(f"Cannot create link for empty URL, original src: {src}")
 
-        # Process web URLs in markdown
-        for match in re.finditer(URL_PATTERN, markdown_content):
+        # Collect web URLs in markdown (every match contains '](http', skip the scan without it)
+        web_urls = []
+        matches = URL_PATTERN.finditer(markdown_content) if '](http' in markdown_content else ()
+        for match in matches:
             url = match.group(2)
-            
+
             # Skip empty URLs
             if not url:
                 self.logger.warning("Skipping empty URL in markdown")
                 continue
 
-            if url not in self.checked_urls:
-                _, is_valid, status = self.verify_web_url(url)
+            web_urls.append(url)
+
+        # Verify all unchecked URLs of this page concurrently
+        pending = [url for url in dict.fromkeys(web_images + web_urls) if url not in self.checked_urls]
+        results = dict(zip(pending, self._url_executor.map(self.verify_web_url, pending)))
+
+        for src in web_images:
+            url, is_valid, status = results.pop(src, (src, True, "Already checked"))
+            if not is_valid:
+                self.logger.warning(f"Image verification failed but keeping link: {url} - {status}")
+
+        for url in web_urls:
+            if url in results:
+                _, is_valid, status = results.pop(url)
                 if not is_valid:
                     self.logger.warning(f"Web URL verification failed but keeping link: {url} - {status}")
 
@@ -622,8 +731,18 @@ class LinkChecker:
         """
         Process video links in markdown content
         """
-        # Use BeautifulSoup for HTML parsing (needed for INVALID_VIDEO_INDICATOR detection)
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Most pages have no videos, skip parsing them
+        if not VIDEO_TAG_PATTERN.search(html_content):
+            self.logger.debug("No videos found in markdown body")
+            return markdown_content
+
+        # Videos only need work where html2text left the fallback text behind
+        if self.config.INVALID_VIDEO_INDICATOR not in markdown_content:
+            self.logger.debug("No invalid video links found in markdown body")
+            return markdown_content
+
+        # Use BeautifulSoup for HTML parsing (needed for INVALID_VIDEO_INDICATOR detection), only building the <video> tags
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=VIDEO_STRAINER)
         videos = []
 
         # Find all video elements in the HTML
@@ -638,15 +757,15 @@ class LinkChecker:
                 page_id = None
                 
                 # Remove the 'download/' prefix from the src
-                src = re.sub(r'^(/?)download/', '', src)
+                src = DOWNLOAD_PREFIX_PATTERN.sub('', src)
                 # Look for patterns like attachments/PAGE_ID/ATTACHMENT_ID or attachments/PAGE_ID/ATTACHMENT_NAME
-                id_match = re.search(r'attachments/(\d+)/(\d+)', src)
+                id_match = ATTACHMENT_ID_PATTERN.search(src)
                 if id_match:
                     page_id = id_match.group(1)
                     attachment_id = id_match.group(2)
                 else:
                     # If no ID match, try to extract filename
-                    filename_match = re.search(r'attachments/(\d+)/([^/]+)$', src)
+                    filename_match = ATTACHMENT_FILENAME_PATTERN.search(src)
                     if filename_match:
                         page_id = filename_match.group(1)
                         filename = filename_match.group(2)
@@ -663,67 +782,66 @@ class LinkChecker:
             self.logger.debug("No videos found in markdown body")
             return markdown_content
 
-        # Replace the placeholder text with proper wiki links
-        for video in videos:
-            if self.config.INVALID_VIDEO_INDICATOR in markdown_content:
-                # Try to find the attachment in XML data
-                link_path = None
+        # Replace the placeholder text with proper wiki links, one video per indicator in a single pass
+        remaining = markdown_content.split(self.config.INVALID_VIDEO_INDICATOR, len(videos))
+        parts = [remaining[0]]
+        for index, video in enumerate(videos[:len(remaining) - 1]):
+            # Try to find the attachment in XML data
+            link_path = None
+            
+            # Method 1: Try by attachment ID if available
+            if video['attachment_id']:
+                self.logger.debug(f"Processing video attachment ID: {video['attachment_id']}")
+                attachment = self.attachment_processor.xml_processor.get_attachment_by_id(video['attachment_id'])
+                if attachment:
+                    parent_page_id = attachment.get('containerContent_id')
+                    space_key = self.attachment_processor.xml_processor.get_space_key_by_page_id(parent_page_id)
+                    link_path = f"{space_key}/attachments/{parent_page_id}/{attachment['title']}"
+                    self.logger.debug(f"Found video attachment by ID: {video['attachment_id']} -> {link_path}")
+            
+            # Method 2: If no ID or not found, try to match by filename
+            if not link_path:
+                # Look for the attachment by filename across all attachments
+                filename = video['filename']
+                sanitized_filename = self.attachment_processor.xml_processor._sanitize_filename(filename)
                 
-                # Method 1: Try by attachment ID if available
-                if video['attachment_id']:
-                    self.logger.debug(f"Processing video attachment ID: {video['attachment_id']}")
-                    attachment = self.attachment_processor.xml_processor.get_attachment_by_id(video['attachment_id'])
-                    if attachment:
-                        parent_page_id = attachment.get('containerContent_id')
+                # Try to get page ID from the video source if available
+                if video['page_id']:
+                    self.logger.debug(f"Processing video page ID '{video['page_id']}' with filename: {filename}")
+                    # First check attachments on the source page, comparing case-insensitive to handle encoding differences
+                    att = self.attachment_processor.xml_processor.get_page_attachment_by_title(video['page_id'], filename, sanitized_filename)
+                    if att:
+                        parent_page_id = att.get('containerContent_id')
                         space_key = self.attachment_processor.xml_processor.get_space_key_by_page_id(parent_page_id)
-                        link_path = f"{space_key}/attachments/{parent_page_id}/{attachment['title']}"
-                        self.logger.debug(f"Found video attachment by ID: {video['attachment_id']} -> {link_path}")
+                        link_path = f"{space_key}/attachments/{parent_page_id}/{att['title']}"
+                        self.logger.debug(f"Found video attachment by filename on source page: {filename} -> {link_path}")
                 
-                # Method 2: If no ID or not found, try to match by filename
+                # If still not found, try to find by ID in the filename
                 if not link_path:
-                    # Look for the attachment by filename across all attachments
-                    filename = video['filename']
-                    sanitized_filename = self.attachment_processor.xml_processor._sanitize_filename(filename)
-                    
-                    # Try to get page ID from the video source if available
-                    if video['page_id']:
-                        self.logger.debug(f"Processing video page ID '{video['page_id']}' with filename: {filename}")
-                        # First check attachments on the source page
-                        attachments = self.attachment_processor.xml_processor.get_attachments_by_page_id(video['page_id'])
-                        for att in attachments:
-                            # Compare filename (case-insensitive) to handle encoding differences
-                            if att.get('title', '').lower() == filename.lower() or att.get('title', '').lower() == sanitized_filename.lower():
-                                parent_page_id = att.get('containerContent_id')
-                                space_key = self.attachment_processor.xml_processor.get_space_key_by_page_id(parent_page_id)
-                                link_path = f"{space_key}/attachments/{parent_page_id}/{att['title']}"
-                                self.logger.debug(f"Found video attachment by filename on source page: {filename} -> {link_path}")
-                                break
-                    
-                    # If still not found, try to find by ID in the filename
-                    if not link_path:
-                        self.logger.debug(f"No link path found, attempting to find ID in filename: {filename}")
-                        id_match = re.search(r'/(\d+)(?:\.\w+)?$', filename)
-                        if id_match:
-                            potential_id = id_match.group(1)
-                            attachment = self.attachment_processor.xml_processor.get_attachment_by_id(potential_id)
-                            if attachment:
-                                parent_page_id = attachment.get('containerContent_id')
-                                space_key = self.attachment_processor.xml_processor.get_space_key_by_page_id(parent_page_id)
-                                link_path = f"{space_key}/attachments/{parent_page_id}/{attachment['title']}"
-                                self.logger.debug(f"Found video attachment by ID in filename: {potential_id} -> {link_path}")
-                
-                # Method 3: If still not found, use the relative path from the source
-                if not link_path:
-                    self.logger.debug(f"No link path found, attempting to use relative path from source: '{video['src']}'")
-                    link_path = self.make_relative_path(video['src'])
-                    self.logger.debug(f"No attachment found, using source path: {link_path}")
-                
-                # Create the wiki link and replace the indicator
-                wiki_link = self.convert_wikilink(video['filename'], link_path)
-                markdown_content = markdown_content.replace(self.config.INVALID_VIDEO_INDICATOR, wiki_link, 1)
-                self.logger.debug(f"Replaced video indicator with link: {wiki_link}")
+                    self.logger.debug(f"No link path found, attempting to find ID in filename: {filename}")
+                    id_match = FILENAME_ID_PATTERN.search(filename)
+                    if id_match:
+                        potential_id = id_match.group(1)
+                        attachment = self.attachment_processor.xml_processor.get_attachment_by_id(potential_id)
+                        if attachment:
+                            parent_page_id = attachment.get('containerContent_id')
+                            space_key = self.attachment_processor.xml_processor.get_space_key_by_page_id(parent_page_id)
+                            link_path = f"{space_key}/attachments/{parent_page_id}/{attachment['title']}"
+                            self.logger.debug(f"Found video attachment by ID in filename: {potential_id} -> {link_path}")
+            
+            # Method 3: If still not found, use the relative path from the source
+            if not link_path:
+                self.logger.debug(f"No link path found, attempting to use relative path from source: '{video['src']}'")
+                link_path = self.make_relative_path(video['src'])
+                self.logger.debug(f"No attachment found, using source path: {link_path}")
+            
+            # Create the wiki link for the next indicator
+            wiki_link = self.convert_wikilink(video['filename'], link_path)
+            parts.append(wiki_link)
+            parts.append(remaining[index + 1])
+            self.logger.debug(f"Replaced video indicator with link: {wiki_link}")
 
-        return markdown_content
+        return ''.join(parts)
 
     def process_attachment_links(self, markdown_content: str) -> str:
         """
@@ -737,96 +855,106 @@ class LinkChecker:
         """
         self.logger.debug("Processing attachment links in markdown content")
 
-        # First capture the markdown link structure
-        download_pattern = re.compile(r'download/attachments/(\d+)/([^)&>"\']+)(?:\?[^>)]*)?')
+        # Both download and direct attachment links contain this, most pages have neither
+        if 'attachments/' not in markdown_content:
+            return markdown_content
 
-        # Pattern for direct attachment links
-        attachment_pattern = re.compile(r'!\[(.*?)\]\((attachments/\d+/\d+\.[^)]+)\)|\[(.*?)\]\((attachments/\d+/\d+\.[^)]+)\)')
+        xml_processor = self.attachment_processor.xml_processor
 
         def replace_attachments_link(match):
             # Determine if this is an image/embedded link (images never use a description)
-            is_image_link = match.group(1) is not None
-
-            # Extract description and link based on which group matched
-            if is_image_link:
-                description = match.group(1)
-                link = match.group(2)
-            else:
-                description = match.group(3)
-                link = match.group(4)
+            is_image_link = match.group(1) == '!'
+            description = match.group(2)
+            link = match.group(3)
             
             original_link = link
             
-            # Extract attachment ID from the link
-            attachment_match = re.search(r'attachments/(\d+)/(\d+)', link)
-            if attachment_match:
-                page_id = attachment_match.group(1)
-                attachment_id = attachment_match.group(2)
-
-                # Method 1: Try by direct attachment ID lookup
-                attachment = self.attachment_processor.xml_processor.get_attachment_by_id(attachment_id)
-                if attachment:
-                    # Get the actual parent page ID from the attachment data
-                    parent_page_id = attachment.get('containerContent_id')
-                    # Get the space key for the parent page
-                    space_key = self.attachment_processor.xml_processor.get_space_key_by_page_id(parent_page_id)
-                    
-                    # Construct the new link path
-                    new_link = f"{space_key}/attachments/{parent_page_id}/{attachment['title']}"
-                    self.logger.debug(f"Found attachment by ID: {attachment_id}. Replacing link: {original_link} -> {new_link}")
-                else:
-                    # Method 2: Try to find by filename in the page's attachments
-                    filename = os.path.basename(link)
-                    sanitized_filename = self.attachment_processor.xml_processor._sanitize_filename(filename)
-                    
-                    # First check attachments on the source page
-                    attachments = self.attachment_processor.xml_processor.get_attachments_by_page_id(page_id)
-                    attachment_found = False
-                    
-                    for att in attachments:
-                        # Compare filename (case-insensitive) to handle encoding differences
-                        if att.get('title', '').lower() == filename.lower() or att.get('title', '').lower() == sanitized_filename.lower():
-                            parent_page_id = att.get('containerContent_id')
-                            space_key = self.attachment_processor.xml_processor.get_space_key_by_page_id(parent_page_id)
-                            new_link = f"{space_key}/attachments/{parent_page_id}/{att['title']}"
-                            self.logger.debug(f"Found attachment by filename on source page: {filename} -> {new_link}")
+            # The link pattern already captured the page and attachment IDs
+            page_id = match.group(4)
+            attachment_id = match.group(5)
+
+            # Method 1: Try by direct attachment ID lookup
+            attachment = xml_processor.get_attachment_by_id(attachment_id)
+            if attachment:
+                # Get the actual parent page ID from the attachment data
+                parent_page_id = attachment.get('containerContent_id')
+                # Get the space key for the parent page
+                space_key = xml_processor.get_space_key_by_page_id(parent_page_id)
+                
+                # Construct the new link path
+                new_link = f"{space_key}/attachments/{parent_page_id}/{attachment['title']}"
+                self.logger.debug(f"Found attachment by ID: {attachment_id}. Replacing link: {original_link} -> {new_link}")
+            else:
+                # Method 2: Try to find by filename in the page's attachments
+                filename = os.path.basename(link)
+                sanitized_filename = xml_processor._sanitize_filename(filename)
+                
+                # First check attachments on the source page, comparing case-insensitive to handle encoding differences
+                att = xml_processor.get_page_attachment_by_title(page_id, filename, sanitized_filename)
+                attachment_found = False
+                
+                if att:
+                    parent_page_id = att.get('containerContent_id')
+                    space_key = xml_processor.get_space_key_by_page_id(parent_page_id)
+                    new_link = f"{space_key}/attachments/{parent_page_id}/{att['title']}"
+                    self.logger.debug(f"Found attachment by filename on source page: {filename} -> {new_link}")
+                    attachment_found = True
+                
+                # Method 3: If still not found, try to find by ID in the filename
+                if not attachment_found:
+                    id_match = FILENAME_ID_PATTERN.search(filename)
+                    if id_match:
+                        potential_id = id_match.group(1)
+                        attachment = xml_processor.get_attachment_by_id(potential_id)
+                        if attachment:
+                            parent_page_id = attachment.get('containerContent_id')
+                            space_key = xml_processor.get_space_key_by_page_id(parent_page_id)
+                            new_link = f"{space_key}/attachments/{parent_page_id}/{attachment['title']}"
+                            self.logger.debug(f"Found attachment by ID in filename: {potential_id} -> {new_link}")
                             attachment_found = True
-                            break
-                    
-                    # Method 3: If still not found, try to find by ID in the filename
-                    if not attachment_found:
-                        id_match = re.search(r'/(\d+)(?:\.\w+)?$', filename)
-                        if id_match:
-                            potential_id = id_match.group(1)
-                            attachment = self.attachment_processor.xml_processor.get_attachment_by_id(potential_id)
-                            if attachment:
-                                parent_page_id = attachment.get('containerContent_id')
-                                space_key = self.attachment_processor.xml_processor.get_space_key_by_page_id(parent_page_id)
-                                new_link = f"{space_key}/attachments/{parent_page_id}/{attachment['title']}"
-                                self.logger.debug(f"Found attachment by ID in filename: {potential_id} -> {new_link}")
-                                attachment_found = True
-                    
-                    # Method 4: If still not found, use the original link structure but with space key
-                    if not attachment_found:
-                        space_key = self.attachment_processor.xml_processor.get_space_key_by_page_id(page_id)
-                        new_link = f"{space_key}/{original_link}"
-                        self.logger.debug(f"No attachment found, using original link with space key: {new_link}")
                 
-                # Handle embedded vs. non-embedded links differently
-                if is_image_link:
-                    return self.convert_wikilink(description, new_link, is_embedded=True)
-                else:
-                    return self.convert_wikilink(description, new_link)
+                # Method 4: If still not found, use the original link structure but with space key
+                if not attachment_found:
+                    space_key = xml_processor.get_space_key_by_page_id(page_id)
+                    new_link = f"{space_key}/{original_link}"
+                    self.logger.debug(f"No attachment found, using original link with space key: {new_link}")
+            
+            # Handle embedded vs. non-embedded links differently
+            if is_image_link:
+                return self.convert_wikilink(description, new_link, is_embedded=True)
             else:
-                self.logger.debug(f"Link does not contain attachment ID: {original_link}")
-                return match.group(0)
+                return self.convert_wikilink(description, new_link)
+
+        def widen_download_replacement(content, start, end, replacement):
+            # Extract the text being replaced for analysis
+            text_to_replace = content[start:end]
+
+            # Check if there's an extra opening bracket right before our replacement
+            if start > 1:  # Need at least 2 characters before
+                char_before1 = content[start-1]
+                char_before2 = content[start-2]
+
+                # Check for the pattern '[!' before the replacement
+                if char_before2 == '[' and char_before1 == '!':
+                    # This is an embedded link pattern that wasn't fully captured
+                    # Include both characters by adjusting the start position
+                    start -= 2
+                    # Make sure the replacement is an embedded link
+                    if not replacement.startswith('![['):
+                        replacement = '!' + replacement
+                # Also check for just a single '[' before the replacement
+                elif char_before1 == '[' and not text_to_replace.startswith('['):
+                    # Include the extra bracket by adjusting the start position
+                    start -= 1
+
+            return start, end, replacement
 
         # Find all matches and store their positions
         downloads = []
-        for match in download_pattern.finditer(markdown_content):
+        for match in DOWNLOAD_LINK_PATTERN.finditer(markdown_content):
             attachment_page_id = match.group(1)
             filename = match.group(2)
-            sanitized_filename = self.attachment_processor.xml_processor._sanitize_filename(filename)
+            sanitized_filename = xml_processor._sanitize_filename(filename)
             downloads.append((match.start(), match.end(), attachment_page_id, sanitized_filename))
 
         if downloads:
@@ -835,20 +963,17 @@ class LinkChecker:
             replacements = []
             
             for start_pos, end_pos, attachment_page_id, filename in downloads:
-                # Look for the complete link pattern around our match
-                before_text = processed_content[:start_pos]
-                after_text = processed_content[end_pos:]
-                
+                # Look for the complete link pattern around our match, searching in place
                 # Try to find the beginning of the link
                 link_start = -1
                 # Check for wiki links [[...]] pattern first
-                wiki_start = before_text.rfind("[[")
-                if wiki_start > -1 and "]]" in before_text[wiki_start:]:
+                wiki_start = processed_content.rfind("[[", 0, start_pos)
+                if wiki_start > -1 and processed_content.find("]]", wiki_start, start_pos) != -1:
                     link_start = wiki_start
                 else:
                     # Check for standard markdown links
-                    bracket_start = before_text.rfind("[")
-                    if bracket_start > -1 and "](" in before_text[bracket_start:]:
+                    bracket_start = processed_content.rfind("[", 0, start_pos)
+                    if bracket_start > -1 and processed_content.find("](", bracket_start, start_pos) != -1:
                         link_start = bracket_start
                 
                 if link_start == -1:
@@ -856,26 +981,26 @@ class LinkChecker:
                     continue
                 
                 # Find the end of the link (closing parenthesis)
-                close_paren_pos = after_text.find(")")
+                close_paren_pos = processed_content.find(")", end_pos)
                 if close_paren_pos == -1:
                     self.logger.warning(f"Could not find closing parenthesis for: {filename}")
                     continue
                 
                 # Calculate full link boundaries
-                link_end = end_pos + close_paren_pos + 1
+                link_end = close_paren_pos + 1
                 
                 # Extract the full link
                 full_link = processed_content[link_start:link_end]
 
                 # Check if this is a complex nested structure (like [![...](...)](/download/...))
-                is_complex_nested = full_link.startswith('![') and '[' in full_link[2:10]
+                is_complex_nested = full_link.startswith('![') and full_link.find('[', 2, 10) != -1
                 
                 # Get space key for page
-                space_key = self.attachment_processor.xml_processor.get_space_key_by_page_id(attachment_page_id)
+                space_key = xml_processor.get_space_key_by_page_id(attachment_page_id)
                     
                 # Look for the attachment in XML data by filename and page ID
                 attachment = None
-                attachments = self.attachment_processor.xml_processor.get_attachments_by_page_id(attachment_page_id)
+                attachments = xml_processor.get_attachments_by_page_id(attachment_page_id)
                 for att in attachments:
                     if att.get('title', '') == filename:
                         self.logger.debug(f"Attachment found by filename: {filename}")
@@ -885,7 +1010,7 @@ class LinkChecker:
                 # If not found by ID, try filename lookup
                 if not attachment:
                     self.logger.debug(f"Attachment not found by page ID: {attachment_page_id}, attempting name lookup: '{filename}'")
-                    attachment = self.attachment_processor.xml_processor.get_attachment_by_filename(filename)
+                    attachment = xml_processor.get_attachment_by_filename(filename)
 
                 if attachment:
                     #self.logger.debug(f"Found attachment: {attachment}")
@@ -903,12 +1028,10 @@ class LinkChecker:
                 # Extract description if present
                 if "[[" in full_link and "]]" in full_link:
                     # Wiki-style link
-                    desc_match = re.search(r'\[\[(.*?)\]\]', full_link)
-                    description = desc_match.group(1) if desc_match else ""
+                    description = _bracket_text(full_link, '[[', ']]')
                 else:
                     # Regular markdown link
-                    desc_match = re.search(r'\[(.*?)\]', full_link)
-                    description = desc_match.group(1) if desc_match else ""
+                    description = _bracket_text(full_link, '[', ']')
                 
                 # Determine if description should be ignored
                 ignore_description = is_thumbnail or any([
@@ -925,7 +1048,7 @@ class LinkChecker:
                     self.logger.debug(f"Replacing with simple link: {replacement}")
                 else:
                     # Determine if this is an image/embedded link
-                    is_embedded = '!' in full_link[:2]  # Check if ! appears in the first 2 characters
+                    is_embedded = full_link.find('!', 0, 2) != -1  # Check if ! appears in the first 2 characters
                     
                     # For complex nested structures, always use a simple embedded link
                     if is_complex_nested:
@@ -938,39 +1061,29 @@ class LinkChecker:
                 # Store replacement for later application
                 replacements.append((link_start, link_end, replacement))
             
-            # Apply all replacements in reverse order to avoid index shifting
-            for start, end, replacement in sorted(replacements, key=lambda x: x[0], reverse=True):
-                # Extract the text being replaced for analysis
-                text_to_replace = processed_content[start:end]
-                
-                # Log more details about what we're replacing
-                #self.logger.debug(f"Replacing text with '{replacement}'")
-                
-                # Check if there's an extra opening bracket right before our replacement
-                if start > 1:  # Need at least 2 characters before
-                    char_before1 = processed_content[start-1]
-                    char_before2 = processed_content[start-2]
-                    
-                    # Check for the pattern '[!' before the replacement
-                    if char_before2 == '[' and char_before1 == '!':
-                        # This is an embedded link pattern that wasn't fully captured
-                        # Include both characters by adjusting the start position
-                        start -= 2
-                        # Make sure the replacement is an embedded link
-                        if not replacement.startswith('![['):
-                            replacement = '!' + replacement
-                        #self.logger.debug(f"Adjusted start position to include '[!' before: '{replacement}'")
-                    # Also check for just a single '[' before the replacement
-                    elif char_before1 == '[' and not text_to_replace.startswith('['):
-                        # Include the extra bracket by adjusting the start position
-                        start -= 1
-                        #self.logger.debug(f"Adjusted start position to include '[' before: '{replacement}'")
-
-                processed_content = processed_content[:start] + replacement + processed_content[end:]
+            # Widen each replacement from the back so earlier offsets stay valid
+            ordered = sorted(replacements, key=lambda x: x[0], reverse=True)
+            widened = [widen_download_replacement(processed_content, *item) for item in ordered]
+
+            if all(lower[1] <= upper[0] for upper, lower in zip(widened, widened[1:])):
+                # Separate links, join the untouched text and replacements in one pass
+                parts = []
+                cursor = 0
+                for start, end, replacement in reversed(widened):
+                    parts.append(processed_content[cursor:start])
+                    parts.append(replacement)
+                    cursor = end
+                parts.append(processed_content[cursor:])
+                processed_content = ''.join(parts)
+            else:
+                # Nested links share text, so each one has to see the previous rewrite
+                for item in ordered:
+                    start, end, replacement = widen_download_replacement(processed_content, *item)
+                    processed_content = processed_content[:start] + replacement + processed_content[end:]
         else:
             processed_content = markdown_content
         
         # Process all direct attachment links after the download links
-        processed_content = attachment_pattern.sub(replace_attachments_link, processed_content)
+        processed_content = ATTACHMENT_LINK_PATTERN.sub(replace_attachments_link, processed_content)
         
         return processed_content
@@ -0,0 +1,142 @@
+import contextlib
+import io
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import converter
+from config import Config
+
+PAGE_HEAD = '<html><head><title>T</title></head><body>'
+PAGE_TAIL = '<div id="footer"><p>Document generated by Confluence on Feb. 03, 2021 10:12</p></div></body></html>'
+
+
+def _prop(name, value):
+    return f'<property name="{name}"><![CDATA[{value}]]></property>'
+
+
+def _ref(name, cls, ref_id, id_name='id'):
+    return f'<property name="{name}" class="{cls}" package="x"><id name="{id_name}">{ref_id}</id></property>'
+
+
+def _page(page_id, title, parent=None):
+    page = (f'<object class="Page" package="x"><id name="id">{page_id}</id>{_prop("title", title)}'
+            f'{_prop("hibernateVersion", "1")}{_prop("version", "1")}{_prop("contentStatus", "current")}'
+            f'{_ref("creator", "ConfluenceUserImpl", "u1", "key")}{_prop("creationDate", "2020-05-06 11:00:00.000")}')
+    if parent:
+        page += _ref("parent", "Page", parent)
+    return page + '</object>'
+
+
+def _blog_post(blog_id, title, space_id):
+    return (f'<object class="BlogPost" package="x"><id name="id">{blog_id}</id>{_prop("title", title)}'
+            f'{_prop("version", "1")}{_prop("contentStatus", "current")}{_ref("space", "Space", space_id)}'
+            f'{_ref("creator", "ConfluenceUserImpl", "u1", "key")}{_prop("creationDate", "2020-05-07 11:00:00.000")}'
+            '</object>')
+
+
+def _body(body_id, content_class, content_id, body):
+    return (f'<object class="BodyContent" package="x"><id name="id">{body_id}</id>{_prop("body", body)}'
+            f'{_prop("bodyType", "2")}{_ref("content", content_class, content_id)}</object>')
+
+
+BLOG_LISTING = ('<div class="blog-post-listing"><a class="blogHeading" href="/pages/viewpage.action?pageId=100003">'
+                'News</a><div class="endsection"><ul class="label-list"><li class="aui-label">'
+                '<a class="aui-label-split-main" href="#">mytag</a></li></ul></div></div>')
+
+
+def _write_export(root):
+    """Write a minimal space export with two pages linking to each other and a blog post listed on the home page"""
+    html_dir = os.path.join(root, 'input', 'TST')
+    xml_dir = os.path.join(root, 'input-xml', 'Confluence-space-export-TST-123')
+    os.makedirs(html_dir)
+    os.makedirs(xml_dir)
+
+    pages = {
+        'index.html': '<h1>Test Space</h1>',
+        'Home_100001.html': '<h1 id="title-heading">Test Space : Home</h1><p>Go to <a href="Child-Page_100002.html">child</a></p>' + BLOG_LISTING,
+        'Child-Page_100002.html': '<h1 id="title-heading">Test Space : Child Page</h1><p>Back <a href="Home_100001.html">home</a></p>',
+    }
+    for filename, body in pages.items():
+        with open(os.path.join(html_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(PAGE_HEAD + body + PAGE_TAIL)
+
+    objects = [
+        f'<object class="ConfluenceUserImpl" package="x"><id name="key">u1</id>{_prop("name", "alice")}</object>',
+        f'<object class="Space" package="x"><id name="id">900</id>{_prop("name", "Test Space")}{_prop("key", "TST")}'
+        f'{_ref("homePage", "Page", "100001")}</object>',
+        _page(100001, 'Home'),
+        _page(100002, 'Child Page', '100001'),
+        _blog_post(100003, 'News', '900'),
+        _body(200003, 'BlogPost', '100003', '<p>Blog text</p>'),
+    ]
+    with open(os.path.join(xml_dir, 'entities.xml'), 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<hibernate-generic datetime="x">\n'
+                + '\n'.join(objects) + '\n</hibernate-generic>\n')
+
+
+def _read_output(output_folder):
+    """Read all Markdown files of the output folder, keyed by their relative path"""
+    contents = {}
+    for root, _, files in os.walk(output_folder):
+        for filename in files:
+            if filename.endswith('.md'):
+                path = os.path.join(root, filename)
+                with open(path, encoding='utf-8') as f:
+                    contents[os.path.relpath(path, output_folder)] = f.read()
+    return contents
+
+
+class IncrementalConversionTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.mkdtemp()
+        os.chdir(self.tmp)
+        _write_export(self.tmp)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _convert(self, **settings):
+        config = Config(INPUT_FOLDER='input', INPUT_FOLDER_XML='input-xml', OUTPUT_FOLDER='output')
+        for name, value in settings.items():
+            setattr(config, name, value)
+        logger = logging.getLogger('test_incremental')
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        converter.config = config
+        converter.logger = logger
+        with contextlib.redirect_stdout(io.StringIO()):
+            converter.main(config, logger)
+        return _read_output('output')
+
+    def _assert_second_run_unchanged(self, **settings):
+        first = self._convert(INCREMENTAL=True, **settings)
+        self.assertIn(os.path.join('TST', 'Child Page.md'), first)
+
+        # The outputs of the first run are newer than the sources, so every page is skipped now
+        second = self._convert(INCREMENTAL=True, **settings)
+        self.assertEqual(first, second)
+        return second
+
+    def test_second_incremental_run_keeps_markdown_links(self):
+        self._assert_second_run_unchanged(USE_WIKI_LINKS=False)
+
+    def test_second_incremental_run_keeps_wikilinks(self):
+        self._assert_second_run_unchanged(USE_WIKI_LINKS=True)
+
+    def test_second_incremental_run_keeps_blog_post_tags(self):
+        blog_post = os.path.join('TST', 'blogposts', 'News.md')
+        first = self._assert_second_run_unchanged(YAML_HEADER_BLOG='---\nauthor: [username]\ntags:\n  - ""\n---')
+        self.assertIn(blog_post, first)
+        self.assertIn('  - "mytag"', first[blog_post])
+
+
+if __name__ == '__main__':
+    unittest.main()
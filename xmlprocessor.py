@@ -1,15 +1,46 @@
 import os
 import re
+import sys
 import logging
 from urllib.parse import unquote
 import unicodedata
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 from typing import Dict, Optional, Tuple, List
 
 from config import Config
 from conversionstats import ConversionStats
 
-INVALID_CHARS = re.compile(r'[+/\\:*?&"<>|^\[\]]')
+INVALID_CHARS_TABLE = str.maketrans(dict.fromkeys('+/\\:*?&"<>|^[]', '-'))  # Characters replaced by dashes in filenames
+TITLE_PROPERTY_PATTERN = re.compile(r'<property name="title">(.*?)</property>', re.DOTALL)  # Content of a serialized title property
+FILENAME_ID_PATTERN = re.compile(r'^(.*?)_(\d{6,10})\.html$')  # Page filename ending in its ID, e.g. Some-Page_48267601.html
+FILENAME_TITLE_PATTERN = re.compile(r'^(.*?)(?:_\d+)?\.html$')  # Page filename made from its title, e.g. Some-Page.html
+ATTACHMENT_PAGE_ID_PATTERN = re.compile(r'/attachments/(\d+)/')  # Page ID in an attachment link path
+XML_OBJECT_CLASSES = {  # Object classes read from entities.xml, all others are dropped after parsing
+    'ConfluenceUserImpl', 'Space', 'Page', 'BlogPost', 'Comment', 'BodyContent',
+    'Attachment', 'OutgoingLink', 'Label', 'Labelling', 'pageProperty',
+}
+
+def _index_children(obj: ET.Element) -> Dict[Tuple[str, Optional[str]], List[ET.Element]]:
+    """Group the direct children of an XML object by (tag, name attribute), so reading its fields scans it once"""
+    children = {}
+    for child in obj:
+        children.setdefault((child.tag, child.get('name')), []).append(child)
+    return children
+
+def _find_child(children: Dict[Tuple[str, Optional[str]], List[ET.Element]], tag: str, name: str, id_name: Optional[str] = None) -> Optional[ET.Element]:
+    """
+    Look up a child in an index from _index_children, like obj.find("./tag[@name='name']").
+
+    With id_name, like obj.find("./tag[@name='name']/id[@name='id_name']") instead.
+    """
+    for elem in children.get((tag, name), ()):
+        if id_name is None:
+            return elem
+        for sub in elem:
+            if sub.tag == 'id' and sub.get('name') == id_name:
+                return sub
+    return None
 
 class XmlProcessor:
     def __init__(self, config: Config, logger: logging.Logger, stats: ConversionStats, xml_path: Optional[str] = None):
@@ -26,12 +57,23 @@ class XmlProcessor:
         self.page = {}  # Page/BlogPost ID -> page object with all related items
         self.users = {}   # User ID -> User info
         self.attachments = {}  # Attachment ID -> Attachment object with detailed info
+        self.comments = {}  # Comment ID -> Comment object, linked to its page and body
+        self._attachments_by_page = None  # Page ID -> attachments, built on first lookup (reset when attachments change)
+        self._attachment_by_title = None  # Title -> first attachment with that title, built like _attachments_by_page
+        self._attachment_titles_by_page = {}  # Page ID -> {lowercased title: (position, attachment)}, filled per page on lookup
 
         # Helper caches for lookup
         self._space_by_key = {}  # Space key -> Space ID
+        self._spaces_by_homepage = {}  # Homepage ID -> spaces with that homepage, in space order
+        self._space_by_blog_id = {}  # Blog post ID -> ID of the first space listing it
         self._page_by_title = {}  # page title -> page ID
-        self._page_by_title_space = {}  # "title:spaceId" -> page ID
+        self._page_by_title_space = {}  # (title, spaceId) -> page ID
         self._label_by_id = {}  # name -> label ID
+        self._sanitized_filenames = {}  # Raw filename -> sanitized filename
+        self._valid_char_table = {}  # Code point -> itself, or None if is_valid_char rejects it (translate table)
+        self._space_key_by_page = {}  # Page ID -> space key, filled on first successful lookup
+        self._page_id_by_filename = {}  # HTML filename -> page ID or None from the filename lookup, reset when XML data is added
+        self._page_by_lower_title = None  # Lowercased title -> (position, page ID) of its first page, built on first lookup
         self.page_id_mapping = {}  # Old Page ID -> New Page ID
 
         # Track processed XML files
@@ -58,8 +100,8 @@ class XmlProcessor:
 
         logger.debug(f"Looking for XML file for space key: {space_key}")
 
-        # Pattern to match Confluence export folders for this space key
-        pattern = re.compile(f"Confluence-space-export-{re.escape(space_key)}-.*")
+        # Prefix of the Confluence export folders for this space key
+        export_prefix = f"Confluence-space-export-{space_key}-"
 
         # Look for matching items in the XML input directory
         input_xml_path = config.INPUT_FOLDER_XML
@@ -67,7 +109,7 @@ class XmlProcessor:
         try:
             # First, check if there's a matching folder in the input-xml directory
             for item in os.listdir(input_xml_path):
-                if pattern.match(item):
+                if item.startswith(export_prefix):
                     item_path = os.path.join(input_xml_path, item)
 
                     # Check if this is a directory that contains entities.xml
@@ -111,40 +153,41 @@ class XmlProcessor:
                 self.logger.error(f"XML file not found: {xml_path}")
                 return False
 
-            # Parse XML file
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
+            # Parse XML file once, grouping the objects by class
+            objects = self._parse_objects_by_class(xml_path)
 
             # Extract data from this XML file
-            self._extract_users(root)
-            self._extract_spaces(root)
-            self._extract_pages(root)
-            self._extract_comments(root)
+            self._extract_users(objects)
+            space_id = self._extract_spaces(objects)
+            self._extract_pages(objects, space_id)
+            self._extract_comments(objects)
 
             # Extract body content and apply relations
-            body_page_relations = self._extract_body_page(root)
+            body_page_relations = self._extract_body_page(objects)
             success_count, missing_count = self._apply_body_page_relations(body_page_relations, self.page)
             
             # Update stats with body links results if stats object exists
-            if hasattr(self, 'stats') and self.stats:
+            if self.stats:
                 self.stats.increment_body_links_stats(success_count, missing_count)
             
             # Link comments to their parent pages
             self._link_comments_to_pages()
 
             # Now extract attachments (after comments and body content are linked)
-            self._extract_attachments(root)
+            self._extract_attachments(objects)
             
             # Finally extract other page relations
-            self._extract_outgoing_links(root)
-            self._extract_labels_and_labellings(root)
-            self._extract_page_properties(root) 
+            self._extract_outgoing_links(objects)
+            self._extract_labels_and_labellings(objects)
+            self._extract_page_properties(objects) 
 
             # Mark as processed
             self.processed_xml_files.add(xml_path)
 
             # Rebuild helper indexes after adding new data
             self._build_helper_indexes()
+            self._page_id_by_filename = {}
+            self._page_by_lower_title = None
 
             # Mark homepage titles if configured
             if hasattr(self.config, 'UNDERSCORE_HOMEPAGE_TITLES') and self.config.UNDERSCORE_HOMEPAGE_TITLES:
@@ -165,13 +208,29 @@ class XmlProcessor:
             self.logger.error(f"Error processing XML file {xml_path}: {str(e)}", exc_info=True)
             return False
 
-    def _extract_users(self, root: ET.Element) -> None:
+    def _parse_objects_by_class(self, xml_path: str) -> Dict[str, List[ET.Element]]:
+        """
+        Parse an XML file in one pass and group its objects by class, in document order.
+
+        Only the classes in XML_OBJECT_CLASSES are kept, so the rest of the tree
+        can be freed once parsing is done instead of being searched by every extractor.
+        """
+        objects = {}
+        for _, elem in ET.iterparse(xml_path, events=('start',)):
+            if elem.tag == 'object':
+                object_class = elem.get('class')
+                if object_class in XML_OBJECT_CLASSES:
+                    objects.setdefault(object_class, []).append(elem)
+        return objects
+
+    def _extract_users(self, objects: Dict[str, List[ET.Element]]) -> None:
         """Extract all users from XML."""
         self.logger.debug(f"Extracting users from XML")
         user_count = 0
 
-        for user_obj in root.findall(".//object[@class='ConfluenceUserImpl']"):
-            id_elem = user_obj.find("./id[@name='key']")
+        for user_obj in objects.get('ConfluenceUserImpl', ()):
+            children = _index_children(user_obj)
+            id_elem = _find_child(children, 'id', 'key')
             if id_elem is None or not id_elem.text:
                 continue
 
@@ -189,17 +248,17 @@ class XmlProcessor:
             }
 
             # Get name
-            name_elem = user_obj.find("./property[@name='name']")
+            name_elem = _find_child(children, 'property', 'name')
             if name_elem is not None and name_elem.text:
                 user["name"] = name_elem.text.strip()
 
             # Get lower name
-            lower_name_elem = user_obj.find("./property[@name='lowerName']")
+            lower_name_elem = _find_child(children, 'property', 'lowerName')
             if lower_name_elem is not None and lower_name_elem.text:
                 user["lowerName"] = lower_name_elem.text.strip()
 
             # Get email
-            email_elem = user_obj.find("./property[@name='email']")
+            email_elem = _find_child(children, 'property', 'email')
             if email_elem is not None and email_elem.text:
                 user["email"] = email_elem.text.strip()
 
@@ -209,11 +268,13 @@ class XmlProcessor:
         if self.stats:
             self.stats.update_xml_stats("users_extracted", user_count)
 
-    def _extract_spaces(self, root: ET.Element) -> None:
-        """Extract all spaces from XML."""
+    def _extract_spaces(self, objects: Dict[str, List[ET.Element]]) -> Optional[str]:
+        """Extract all spaces from XML. Returns the ID of the first space found in this file."""
         self.logger.debug(f"Extracting space from XML")
-        for space_obj in root.findall(".//object[@class='Space']"):
-            id_elem = space_obj.find("./id[@name='id']")
+        first_space_id = None
+        for space_obj in objects.get('Space', ()):
+            children = _index_children(space_obj)
+            id_elem = _find_child(children, 'id', 'id')
             if id_elem is None or not id_elem.text:
                 continue
 
@@ -234,82 +295,88 @@ class XmlProcessor:
             }
 
             # Get name
-            name_elem = space_obj.find("./property[@name='name']")
+            name_elem = _find_child(children, 'property', 'name')
             if name_elem is not None and name_elem.text:
                 space["name"] = name_elem.text.strip()
 
             # Get key
-            key_elem = space_obj.find("./property[@name='key']")
+            key_elem = _find_child(children, 'property', 'key')
             if key_elem is not None and key_elem.text:
                 space["key"] = key_elem.text.strip()
 
             # Get creator ID
-            creator_elem = space_obj.find("./property[@name='creator']/id[@name='key']")
+            creator_elem = _find_child(children, 'property', 'creator', 'key')
             if creator_elem is not None and creator_elem.text:
-                space["creatorId"] = creator_elem.text.strip()
+                space["creatorId"] = sys.intern(creator_elem.text.strip())
 
             # Get creation date
-            creation_date_elem = space_obj.find("./property[@name='creationDate']")
+            creation_date_elem = _find_child(children, 'property', 'creationDate')
             if creation_date_elem is not None and creation_date_elem.text:
                 space["creationDate"] = creation_date_elem.text.strip()
 
             # Get last modifier ID
-            last_mod_elem = space_obj.find("./property[@name='lastModifier']/id[@name='key']")
+            last_mod_elem = _find_child(children, 'property', 'lastModifier', 'key')
             if last_mod_elem is not None and last_mod_elem.text:
-                space["lastModifierId"] = last_mod_elem.text.strip()
+                space["lastModifierId"] = sys.intern(last_mod_elem.text.strip())
 
             # Get last modification date
-            last_mod_date_elem = space_obj.find("./property[@name='lastModificationDate']")
+            last_mod_date_elem = _find_child(children, 'property', 'lastModificationDate')
             if last_mod_date_elem is not None and last_mod_date_elem.text:
                 space["lastModificationDate"] = last_mod_date_elem.text.strip()
 
             # Get home page ID
-            home_page_elem = space_obj.find("./property[@name='homePage']/id[@name='id']")
+            home_page_elem = _find_child(children, 'property', 'homePage', 'id')
             if home_page_elem is not None and home_page_elem.text:
                 space["homePageId"] = home_page_elem.text.strip()
 
             self.spaces[space_id] = space
+            if first_space_id is None:
+                first_space_id = space_id
+
+        return first_space_id
 
-    def _extract_pages(self, root: ET.Element) -> None:
+    def _extract_pages(self, objects: Dict[str, List[ET.Element]], space_id: Optional[str]) -> None:
         self.logger.debug(f"Extracting pages from XML")
         """Extract all pages and blog posts from XML, only keeping the highest hibernateVersion of each title."""
         # Create dictionaries to track the highest hibernateVersion of each page/blog by title
         page_versions = {}  # title -> (hibernateVersion, page_obj)
         blog_versions = {}  # title -> (hibernateVersion, blog_obj)
+        page_ids_by_title = {}  # title -> IDs of all page versions (drafts included), in document order
+        blog_ids_by_title = {}  # title -> IDs of all blog versions (drafts included), in document order
 
-        # Find the space ID from the Space object
-        space_id = None
-        for space_obj in root.findall(".//object[@class='Space']"):
-            id_elem = space_obj.find("./id[@name='id']")
-            if id_elem is not None and id_elem.text:
-                space_id = id_elem.text.strip()
-                #self.logger.debug(f"Found space ID: {space_id}")
-                break
-
+        # The space ID comes from the first Space object, found by _extract_spaces
         if not space_id:
             self.logger.warning("No space ID found in XML, cannot process pages")
             return
 
+        debug = self.logger.isEnabledFor(logging.DEBUG)  # Skip building per-object debug messages when disabled
+
         # First pass: collect all versions and find the highest for each page title
         self.logger.debug(f"Collecting page versions")
-        for page_obj in root.findall(".//object[@class='Page']"):
+        for page_obj in objects.get('Page', ()):
             # Get page ID for logging
             id_elem = page_obj.find("./id[@name='id']")
             page_id = id_elem.text.strip() if id_elem is not None and id_elem.text else "unknown"
+
+            # Remember every version of a title, they all get mapped to the newest one later
+            title_elem = page_obj.find("./property[@name='title']")
+            if id_elem is not None and id_elem.text and title_elem is not None and title_elem.text:
+                page_ids_by_title.setdefault(title_elem.text.strip(), []).append(page_id)
             
             # Check if this is a draft - skip if it is
             status_elem = page_obj.find("./property[@name='contentStatus']")
             # contentStatus can be: current, deleted, draft
             if status_elem is not None and status_elem.text and status_elem.text.strip() == "draft":
-                self.logger.debug(f"Skipping draft page id '{page_id}'")
+                if debug:
+                    self.logger.debug(f"Skipping draft page id '{page_id}'")
                 continue
             
 
             # Get title
-            title_elem = page_obj.find("./property[@name='title']")
             if title_elem is None or not title_elem.text:
                 # Skip pages without titles
-                self.logger.debug(f"Skipping page '{page_id}' with no title")
+                if debug:
+                    self.logger.debug(f"Skipping page '{page_id}' with no title")
                 continue
             title = title_elem.text.strip()
 
@@ -331,7 +398,7 @@ class XmlProcessor:
 
         # Same for blog posts
         self.logger.debug(f"Collecting blog versions")
-        for blog_obj in root.findall(".//object[@class='BlogPost']"):
+        for blog_obj in objects.get('BlogPost', ()):
             # Get blog ID
             id_elem = blog_obj.find("./id[@name='id']")
             if id_elem is None or not id_elem.text:
@@ -345,18 +412,24 @@ class XmlProcessor:
             title_elem = blog_obj.find("./property[@name='title']")
             if title_elem is None or not title_elem.text:
                 # Skip blogs without titles
-                self.logger.debug(f"Skipping blog '{blog_id}' with no title")
+                if debug:
+                    self.logger.debug(f"Skipping blog '{blog_id}' with no title")
                 continue
             title = title_elem.text.strip()
+
+            # Remember every version of a title, they all get mapped to the newest one later
+            blog_ids_by_title.setdefault(title, []).append(blog_id)
             
             # Check if this is a draft - skip if it is
             status_elem = blog_obj.find("./property[@name='contentStatus']")
             # contentStatus can be: current, deleted, draft
             if status_elem is not None and status_elem.text and status_elem.text.strip() == "draft":
-                self.logger.debug(f"Skipping draft blog with title '{title}'")
+                if debug:
+                    self.logger.debug(f"Skipping draft blog with title '{title}'")
                 continue
             if status_elem is not None and status_elem.text and status_elem.text.strip() == "deleted":
-                self.logger.debug(f"Skipping deleted blog with title '{title}'")
+                if debug:
+                    self.logger.debug(f"Skipping deleted blog with title '{title}'")
                 continue
 
             # Get hibernateVersion number
@@ -381,18 +454,14 @@ class XmlProcessor:
         for title, (hibernate_version, page_obj) in page_versions.items():
             id_elem = page_obj.find("./id[@name='id']")
             newest_page_id = id_elem.text.strip() if id_elem is not None and id_elem.text else "unknown"
-            self.logger.debug(f"Processing highest hibernateVersion '{hibernate_version}' of page '{title}' (ID: '{newest_page_id}')")
+            if debug:
+                self.logger.debug(f"Processing highest hibernateVersion '{hibernate_version}' of page '{title}' (ID: '{newest_page_id}')")
 
             # Update all page IDs with this title to point to the newest version
-            for page_obj_all in root.findall(".//object[@class='Page']"):
-                title_elem_all = page_obj_all.find("./property[@name='title']")
-                if title_elem_all is not None and title_elem_all.text and title_elem_all.text.strip() == title:
-                    id_elem_all = page_obj_all.find("./id[@name='id']")
-                    if id_elem_all is not None and id_elem_all.text:
-                        old_page_id = id_elem_all.text.strip()
-                        self.page_id_mapping[old_page_id] = newest_page_id
-                        if old_page_id != newest_page_id:
-                            self.logger.debug(f"Mapping old page ID '{old_page_id}' to newest version '{newest_page_id}'")
+            for old_page_id in page_ids_by_title.get(title, ()):
+                self.page_id_mapping[old_page_id] = newest_page_id
+                if debug and old_page_id != newest_page_id:
+                    self.logger.debug(f"Mapping old page ID '{old_page_id}' to newest version '{newest_page_id}'")
 
             self._extract_page_item(page_obj, "Page", space_id)
             
@@ -400,24 +469,21 @@ class XmlProcessor:
         for title, (hibernate_version, blog_obj) in blog_versions.items():
             id_elem = blog_obj.find("./id[@name='id']")
             newest_blog_id = id_elem.text.strip() if id_elem is not None and id_elem.text else "unknown"
-            self.logger.debug(f"Processing highest hibernateVersion '{hibernate_version}' of blog '{title}' (ID: '{newest_blog_id}')")
+            if debug:
+                self.logger.debug(f"Processing highest hibernateVersion '{hibernate_version}' of blog '{title}' (ID: '{newest_blog_id}')")
             
             # Update all blog IDs with this title to point to the newest version
-            for blog_obj_all in root.findall(".//object[@class='BlogPost']"):
-                title_elem_all = blog_obj_all.find("./property[@name='title']")
-                if title_elem_all is not None and title_elem_all.text and title_elem_all.text.strip() == title:
-                    id_elem_all = blog_obj_all.find("./id[@name='id']")
-                    if id_elem_all is not None and id_elem_all.text:
-                        old_blog_id = id_elem_all.text.strip()
-                        self.page_id_mapping[old_blog_id] = newest_blog_id
-                        if old_blog_id != newest_blog_id:
-                            self.logger.debug(f"Mapping old blog ID '{old_blog_id}' to newest version '{newest_blog_id}'")
+            for old_blog_id in blog_ids_by_title[title]:
+                self.page_id_mapping[old_blog_id] = newest_blog_id
+                if debug and old_blog_id != newest_blog_id:
+                    self.logger.debug(f"Mapping old blog ID '{old_blog_id}' to newest version '{newest_blog_id}'")
 
             self._extract_blog_item(blog_obj, "BlogPost")
 
     def _extract_page_item(self, page_obj: ET.Element, page_type: str, space_id: str) -> None:
         """Extract a page or blog post from XML, keeping only the highest version."""
-        id_elem = page_obj.find("./id[@name='id']")
+        children = _index_children(page_obj)
+        id_elem = _find_child(children, 'id', 'id')
         if id_elem is None or not id_elem.text:
             return
 
@@ -425,27 +491,18 @@ class XmlProcessor:
         page_id = str(id_elem.text.strip())
 
         # Get title
-        title_elem = page_obj.find("./property[@name='title']")
+        title_elem = _find_child(children, 'property', 'title')
         if title_elem is None or not title_elem.text:
             self.logger.warning(f"No title found for {page_type} {page_id}, using ID as title")
             title = page_id
         else:
             # Extract text content
-            raw_xml = ET.tostring(title_elem, encoding='unicode')
-            tag_name = title_elem.tag
-            attr_name = 'name'
-            attr_value = title_elem.get(attr_name)
-            pattern = f'<{tag_name} {attr_name}="{attr_value}">(.*?)</{tag_name}>'
-            match = re.search(pattern, raw_xml, re.DOTALL)
-            if match:
-                title = match.group(1)
-            else:
-                title = title_elem.text or f"{page_id}"
+            title = self._title_text(title_elem, page_id)
 
         title = self._sanitize_filename(title)
 
         # Get version
-        version_elem = page_obj.find("./property[@name='version']")
+        version_elem = _find_child(children, 'property', 'version')
         version = 0
         if version_elem is not None and version_elem.text:
             try:
@@ -475,50 +532,59 @@ class XmlProcessor:
         }
 
         # Get page status
-        status_elem = page_obj.find("./property[@name='pageStatus']")
+        status_elem = _find_child(children, 'property', 'pageStatus')
         if status_elem is not None and status_elem.text:
             page["status"] = status_elem.text.strip()
 
         # Add this page to the space's list of pages
-        if space_id in self.spaces:
-            if page_type == "Page":
-                self.spaces[space_id]["pageIds"].add(page_id)
-            else:
-                self.spaces[space_id]["blogPostIds"].add(page_id)
+        space = self.spaces.get(space_id)
+        if space is not None:
+            space["pageIds" if page_type == "Page" else "blogPostIds"].add(page_id)
 
         # Get parent ID (for pages)
         if page_type == "Page":
-            parent_elem = page_obj.find("./property[@name='parent']/id[@name='id']")
+            parent_elem = _find_child(children, 'property', 'parent', 'id')
             if parent_elem is not None and parent_elem.text:
-                page["parentId"] = parent_elem.text.strip()
+                page["parentId"] = sys.intern(parent_elem.text.strip())
 
         # Get creator ID
-        creator_elem = page_obj.find("./property[@name='creator']/id[@name='key']")
+        creator_elem = _find_child(children, 'property', 'creator', 'key')
         if creator_elem is not None and creator_elem.text:
-            page["creatorId"] = creator_elem.text.strip()
+            page["creatorId"] = sys.intern(creator_elem.text.strip())
 
         # Get creation date
-        creation_date_elem = page_obj.find("./property[@name='creationDate']")
+        creation_date_elem = _find_child(children, 'property', 'creationDate')
         if creation_date_elem is not None and creation_date_elem.text:
             page["creationDate"] = creation_date_elem.text.strip()
 
         # Get last modifier ID
-        last_mod_elem = page_obj.find("./property[@name='lastModifier']/id[@name='key']")
+        last_mod_elem = _find_child(children, 'property', 'lastModifier', 'key')
         if last_mod_elem is not None and last_mod_elem.text:
-            page["lastModifierId"] = last_mod_elem.text.strip()
+            page["lastModifierId"] = sys.intern(last_mod_elem.text.strip())
 
         # Get last modification date
-        last_mod_date_elem = page_obj.find("./property[@name='lastModificationDate']")
+        last_mod_date_elem = _find_child(children, 'property', 'lastModificationDate')
         if last_mod_date_elem is not None and last_mod_date_elem.text:
             page["lastModificationDate"] = last_mod_date_elem.text.strip()
 
         # Store in cache
         self.page[page_id] = page
-
-        # Update lookup dictionaries
-        self._page_by_title[title] = page_id
-        self._page_by_title_space[f"{title}:{space_id}"] = page_id 
  
+    def _title_text(self, title_elem: ET.Element, item_id: str) -> str:
+        """
+        Get the text of a title property as it appears in the XML file (markup characters stay escaped).
+
+        Plain title properties are escaped directly, only unusual ones are serialized and matched.
+        """
+        if len(title_elem) == 0 and title_elem.attrib == {'name': 'title'}:
+            return escape(title_elem.text)
+
+        raw_xml = ET.tostring(title_elem, encoding='unicode')
+        match = TITLE_PROPERTY_PATTERN.search(raw_xml)
+        if match:
+            return match.group(1)
+        return title_elem.text or f"{item_id}"
+
     def _extract_blog_item(self, blog_obj: ET.Element, blog_type: str = "BlogPost") -> None:
         """
         Extract a blog post from XML.
@@ -527,7 +593,8 @@ class XmlProcessor:
         blog_obj: The XML element containing the blog post data
         blog_type: The type of blog post (typically "BlogPost")
         """
-        id_elem = blog_obj.find("./id[@name='id']")
+        children = _index_children(blog_obj)
+        id_elem = _find_child(children, 'id', 'id')
         if id_elem is None or not id_elem.text:
             return
 
@@ -535,7 +602,7 @@ class XmlProcessor:
         blog_id = str(id_elem.text.strip())
 
         # Get space ID - with proper error handling
-        space_elem = blog_obj.find("./property[@name='space']/id[@name='id']")
+        space_elem = _find_child(children, 'property', 'space', 'id')
 
         if space_elem is None:
             self.logger.warning(f"No space element found for {blog_type} {blog_id}, skipping")
@@ -545,31 +612,21 @@ class XmlProcessor:
             self.logger.warning(f"Skipping empty space ID for {blog_type} {blog_id}")
             return
 
-        space_id = space_elem.text.strip()
+        space_id = sys.intern(space_elem.text.strip())
 
         # Get title
-        title_elem = blog_obj.find("./property[@name='title']")
+        title_elem = _find_child(children, 'property', 'title')
         if title_elem is None or not title_elem.text:
             self.logger.warning(f"No title found for {blog_type} {blog_id}, using ID as title")
             title = blog_id
         else:
             # Extract text content, handling CDATA sections
-            raw_xml = ET.tostring(title_elem, encoding='unicode')
-            tag_name = title_elem.tag
-            attr_name = 'name'
-            attr_value = title_elem.get(attr_name)
-            pattern = f'<{tag_name} {attr_name}="{attr_value}">(.*?)</{tag_name}>'
-            match = re.search(pattern, raw_xml, re.DOTALL)
-
-            if match:
-                title = match.group(1)
-            else:
-                title = title_elem.text or f"{blog_id}"
+            title = self._title_text(title_elem, blog_id)
 
         title = self._sanitize_filename(title)
 
         # Get version
-        version_elem = blog_obj.find("./property[@name='version']")
+        version_elem = _find_child(children, 'property', 'version')
         version = 0
         if version_elem is not None and version_elem.text:
             try:
@@ -598,48 +655,46 @@ class XmlProcessor:
         }
 
         # Get blog post status
-        status_elem = blog_obj.find("./property[@name='contentStatus']")
+        status_elem = _find_child(children, 'property', 'contentStatus')
         if status_elem is not None and status_elem.text:
             blog["status"] = status_elem.text.strip()
 
         # Add this blog post to the space's list of blog posts
-        if space_id in self.spaces:
-            self.spaces[space_id]["blogPostIds"].add(blog_id)
+        space = self.spaces.get(space_id)
+        if space is not None:
+            space["blogPostIds"].add(blog_id)
 
         # Get creator ID
-        creator_elem = blog_obj.find("./property[@name='creator']/id[@name='key']")
+        creator_elem = _find_child(children, 'property', 'creator', 'key')
         if creator_elem is not None and creator_elem.text:
-            blog["creatorId"] = creator_elem.text.strip()
+            blog["creatorId"] = sys.intern(creator_elem.text.strip())
 
         # Get creation date
-        creation_date_elem = blog_obj.find("./property[@name='creationDate']")
+        creation_date_elem = _find_child(children, 'property', 'creationDate')
         if creation_date_elem is not None and creation_date_elem.text:
             blog["creationDate"] = creation_date_elem.text.strip()
 
         # Get last modifier ID
-        last_mod_elem = blog_obj.find("./property[@name='lastModifier']/id[@name='key']")
+        last_mod_elem = _find_child(children, 'property', 'lastModifier', 'key')
         if last_mod_elem is not None and last_mod_elem.text:
-            blog["lastModifierId"] = last_mod_elem.text.strip()
+            blog["lastModifierId"] = sys.intern(last_mod_elem.text.strip())
 
         # Get last modification date
-        last_mod_date_elem = blog_obj.find("./property[@name='lastModificationDate']")
+        last_mod_date_elem = _find_child(children, 'property', 'lastModificationDate')
         if last_mod_date_elem is not None and last_mod_date_elem.text:
             blog["lastModificationDate"] = last_mod_date_elem.text.strip()
 
         # Store in cache
         self.page[blog_id] = blog
 
-        # Update lookup dictionaries
-        self._page_by_title[title] = blog_id
-        self._page_by_title_space[f"{title}:{space_id}"] = blog_id
-
-    def _extract_attachments(self, root: ET.Element) -> None:
+    def _extract_attachments(self, objects: Dict[str, List[ET.Element]]) -> None:
         """Extract attachments and link them to their page."""
         self.logger.info(f"Extracting attachments from XML")
         attachment_count = 0
 
-        for att_obj in root.findall(".//object[@class='Attachment']"):
-            id_elem = att_obj.find("./id[@name='id']")
+        for att_obj in objects.get('Attachment', ()):
+            children = _index_children(att_obj)
+            id_elem = _find_child(children, 'id', 'id')
             if id_elem is None or not id_elem.text:
                 self.logger.debug("Skipping attachment - no ID found")
                 continue
@@ -660,32 +715,32 @@ class XmlProcessor:
             }
 
             # Get title (the filename used in the XML)
-            title_elem = att_obj.find("./property[@name='title']")
+            title_elem = _find_child(children, 'property', 'title')
             if title_elem is not None and title_elem.text:
                 attachment["title"] = self._sanitize_filename(title_elem.text.strip())
 
             # Get creator ID
-            creator_elem = att_obj.find("./property[@name='creator']/id[@name='key']")
+            creator_elem = _find_child(children, 'property', 'creator', 'key')
             if creator_elem is not None and creator_elem.text:
-                attachment["creatorId"] = creator_elem.text.strip()
+                attachment["creatorId"] = sys.intern(creator_elem.text.strip())
 
             # Get last modifier ID
-            last_mod_elem = att_obj.find("./property[@name='lastModifier']/id[@name='key']")
+            last_mod_elem = _find_child(children, 'property', 'lastModifier', 'key')
             if last_mod_elem is not None and last_mod_elem.text:
-                attachment["lastModifierId"] = last_mod_elem.text.strip()
+                attachment["lastModifierId"] = sys.intern(last_mod_elem.text.strip())
 
             # Get creation date
-            creation_date_elem = att_obj.find("./property[@name='creationDate']")
+            creation_date_elem = _find_child(children, 'property', 'creationDate')
             if creation_date_elem is not None and creation_date_elem.text:
                 attachment["creationDate"] = creation_date_elem.text.strip()
 
             # Get last modification date
-            last_mod_date_elem = att_obj.find("./property[@name='lastModificationDate']")
+            last_mod_date_elem = _find_child(children, 'property', 'lastModificationDate')
             if last_mod_date_elem is not None and last_mod_date_elem.text:
                 attachment["lastModificationDate"] = last_mod_date_elem.text.strip()
 
             # Get version
-            version_elem = att_obj.find("./property[@name='version']")
+            version_elem = _find_child(children, 'property', 'version')
             if version_elem is not None and version_elem.text:
                 try:
                     attachment["version"] = int(version_elem.text.strip())
@@ -693,7 +748,7 @@ class XmlProcessor:
                     pass
 
             # Get hibernateVersion
-            hibernate_version_elem = att_obj.find("./property[@name='hibernateVersion']")
+            hibernate_version_elem = _find_child(children, 'property', 'hibernateVersion')
             if hibernate_version_elem is not None and hibernate_version_elem.text:
                 try:
                     attachment["hibernateVersion"] = int(hibernate_version_elem.text.strip())
@@ -701,31 +756,32 @@ class XmlProcessor:
                     pass
 
             # Get containerContent ID
-            container_elem = att_obj.find("./property[@name='containerContent']/id[@name='id']")
+            container_elem = _find_child(children, 'property', 'containerContent', 'id')
             if container_elem is not None and container_elem.text:
-                attachment["containerContent_id"] = container_elem.text.strip()
+                attachment["containerContent_id"] = sys.intern(container_elem.text.strip())
 
             # Get space ID
-            space_elem = att_obj.find("./property[@name='space']/id[@name='id']")
+            space_elem = _find_child(children, 'property', 'space', 'id')
             if space_elem is not None and space_elem.text:
-                attachment["space_id"] = space_elem.text.strip()
+                attachment["space_id"] = sys.intern(space_elem.text.strip())
 
             # Store in attachments dictionary
             self.attachments[att_id] = attachment
+            self._attachments_by_page = None
+            self._attachment_by_title = None
+            self._attachment_titles_by_page = {}
             attachment_count += 1
         
         self.logger.info(f"Extracted {attachment_count} attachments from XML")
 
-    def _extract_comments(self, root: ET.Element) -> None:
+    def _extract_comments(self, objects: Dict[str, List[ET.Element]]) -> None:
         """Extract comments and create a cache for them."""
         self.logger.info("Extracting comments")
 
-        # Initialize comment cache if it doesn't exist
-        if not hasattr(self, 'comments'):
-            self.comments = {}
-            
-        for comment_obj in root.findall(".//object[@class='Comment']"):
-            id_elem = comment_obj.find("./id[@name='id']")
+        comments = self.comments
+        for comment_obj in objects.get('Comment', ()):
+            children = _index_children(comment_obj)
+            id_elem = _find_child(children, 'id', 'id')
             if id_elem is None or not id_elem.text:
                 continue
 
@@ -740,29 +796,31 @@ class XmlProcessor:
             }
 
             # Get creator ID
-            creator_elem = comment_obj.find("./property[@name='creator']/id[@name='key']")
+            creator_elem = _find_child(children, 'property', 'creator', 'key')
             if creator_elem is not None and creator_elem.text:
-                comment["creatorId"] = creator_elem.text.strip()
+                comment["creatorId"] = sys.intern(creator_elem.text.strip())
 
             # Get creation date
-            creation_date_elem = comment_obj.find("./property[@name='creationDate']")
+            creation_date_elem = _find_child(children, 'property', 'creationDate')
             if creation_date_elem is not None and creation_date_elem.text:
                 comment["creationDate"] = creation_date_elem.text.strip()
 
             # Find the container page (Page or BlogPost)
-            container_elem = comment_obj.find("./property[@name='containerContent']/id[@name='id']")
+            container_elem = _find_child(children, 'property', 'containerContent', 'id')
             if container_elem is not None and container_elem.text:
-                comment["containerContentId"] = container_elem.text.strip()
+                comment["containerContentId"] = sys.intern(container_elem.text.strip())
 
             # Store in cache
-            self.comments[comment_id] = comment
+            comments[comment_id] = comment
 
         self.logger.info(f"Extracted {len(self.comments)} comments")
 
-    def _extract_outgoing_links(self, root: ET.Element) -> None:
+    def _extract_outgoing_links(self, objects: Dict[str, List[ET.Element]]) -> None:
         """Extract outgoing links and link them to their source page."""
-        for link_obj in root.findall(".//object[@class='OutgoingLink']"):
-            id_elem = link_obj.find("./id[@name='id']")
+        pages = self.page
+        for link_obj in objects.get('OutgoingLink', ()):
+            children = _index_children(link_obj)
+            id_elem = _find_child(children, 'id', 'id')
             if id_elem is None or not id_elem.text:
                 continue
 
@@ -775,27 +833,33 @@ class XmlProcessor:
             }
 
             # Get destination page title
-            dest_title_elem = link_obj.find("./property[@name='destinationPageTitle']")
+            dest_title_elem = _find_child(children, 'property', 'destinationPageTitle')
             if dest_title_elem is not None and dest_title_elem.text:
                 link["destinationPageTitle"] = dest_title_elem.text.strip()
 
             # Get destination space key
-            dest_space_elem = link_obj.find("./property[@name='destinationSpaceKey']")
+            dest_space_elem = _find_child(children, 'property', 'destinationSpaceKey')
             if dest_space_elem is not None and dest_space_elem.text:
                 link["destinationSpaceKey"] = dest_space_elem.text.strip()
 
             # Find the source page
-            source_elem = link_obj.find("./property[@name='sourcepage']/id[@name='id']")
+            source_elem = _find_child(children, 'property', 'sourcepage', 'id')
             if source_elem is not None and source_elem.text:
-                page_id = source_elem.text.strip()
-                if page_id in self.page:
-                    self.page[page_id]["outgoingLinks"].append(link)
+                page = pages.get(source_elem.text.strip())
+                if page is not None:
+                    page["outgoingLinks"].append(link)
 
-    def _extract_labels_and_labellings(self, root: ET.Element) -> None:
+    def _extract_labels_and_labellings(self, objects: Dict[str, List[ET.Element]]) -> None:
         """Extract labels and link them to their page via labellings."""
+        # Bind the caches used for every object to locals once
+        label_by_id = self._label_by_id
+        pages = self.page
+        clean_cdata = self._clean_cdata
+
         # First extract all labels
-        for label_obj in root.findall(".//object[@class='Label']"):
-            id_elem = label_obj.find("./id[@name='id']")
+        for label_obj in objects.get('Label', ()):
+            children = _index_children(label_obj)
+            id_elem = _find_child(children, 'id', 'id')
             if id_elem is None or not id_elem.text:
                 continue
 
@@ -808,39 +872,42 @@ class XmlProcessor:
             }
 
             # Get name
-            name_elem = label_obj.find("./property[@name='name']")
+            name_elem = _find_child(children, 'property', 'name')
             if name_elem is not None and name_elem.text:
-                label["name"] = self._clean_cdata(name_elem.text.strip())
+                label["name"] = clean_cdata(name_elem.text.strip())
 
             # Get namespace
-            namespace_elem = label_obj.find("./property[@name='namespace']")
+            namespace_elem = _find_child(children, 'property', 'namespace')
             if namespace_elem is not None and namespace_elem.text:
                 label["namespace"] = namespace_elem.text.strip()
 
-            self._label_by_id[label_id] = label
+            label_by_id[label_id] = label
 
         # Now process labellings and link labels to page
-        for labelling_obj in root.findall(".//object[@class='Labelling']"):
+        for labelling_obj in objects.get('Labelling', ()):
+            children = _index_children(labelling_obj)
             # Get label ID
-            label_elem = labelling_obj.find("./property[@name='label']/id[@name='id']")
+            label_elem = _find_child(children, 'property', 'label', 'id')
             if label_elem is None or not label_elem.text:
                 continue
 
-            label_id = label_elem.text.strip()
-            if label_id not in self._label_by_id:
+            label = label_by_id.get(label_elem.text.strip())
+            if label is None:
                 continue
 
             # Get page ID
-            page_elem = labelling_obj.find("./property[@name='page']/id[@name='id']")
+            page_elem = _find_child(children, 'property', 'page', 'id')
             if page_elem is not None and page_elem.text:
-                page_id = page_elem.text.strip()
-                if page_id in self.page:
-                    self.page[page_id]["labels"].append(self._label_by_id[label_id])
+                page = pages.get(page_elem.text.strip())
+                if page is not None:
+                    page["labels"].append(label)
 
-    def _extract_page_properties(self, root: ET.Element) -> None:
+    def _extract_page_properties(self, objects: Dict[str, List[ET.Element]]) -> None:
         """Extract page properties and link them to their page."""
-        for prop_obj in root.findall(".//object[@class='pageProperty']"):
-            id_elem = prop_obj.find("./id[@name='id']")
+        pages = self.page
+        for prop_obj in objects.get('pageProperty', ()):
+            children = _index_children(prop_obj)
+            id_elem = _find_child(children, 'id', 'id')
             if id_elem is None or not id_elem.text:
                 continue
 
@@ -853,38 +920,41 @@ class XmlProcessor:
             }
 
             # Get name
-            name_elem = prop_obj.find("./property[@name='name']")
+            name_elem = _find_child(children, 'property', 'name')
             if name_elem is not None and name_elem.text:
                 prop["name"] = name_elem.text.strip()
 
             # Get string value
-            value_elem = prop_obj.find("./property[@name='stringValue']")
+            value_elem = _find_child(children, 'property', 'stringValue')
             if value_elem is not None and value_elem.text:
                 prop["stringValue"] = value_elem.text.strip()
 
             # Find the page
-            page_elem = prop_obj.find("./property[@name='page']/id[@name='id']")
+            page_elem = _find_child(children, 'property', 'page', 'id')
             if page_elem is not None and page_elem.text:
-                page_id = page_elem.text.strip()
-                if page_id in self.page:
-                    self.page[page_id]["pageProperties"].append(prop)
+                page = pages.get(page_elem.text.strip())
+                if page is not None:
+                    page["pageProperties"].append(prop)
 
-    def _extract_body_page(self, root: ET.Element) -> List:
+    def _extract_body_page(self, objects: Dict[str, List[ET.Element]]) -> List:
         """
         Extract body page content and link it to its page or comment.
         
         Args:
-            root: XML root element
+            objects: XML objects grouped by class
             
         Returns:
             list: List of tuples (content_id, body_dict) for later linking
         """
         self.logger.info("Starting body page extraction")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        clean_cdata = self._clean_cdata
         
         body_page_relations = []
 
-        for body_obj in root.findall(".//object[@class='BodyContent']"):
-            id_elem = body_obj.find("./id[@name='id']")
+        for body_obj in objects.get('BodyContent', ()):
+            children = _index_children(body_obj)
+            id_elem = _find_child(children, 'id', 'id')
             if id_elem is None or not id_elem.text:
                 self.logger.debug("Skipping body object - no ID found")
                 continue
@@ -900,19 +970,19 @@ class XmlProcessor:
             }
 
             # Get body content
-            body_elem = body_obj.find("./property[@name='body']")
+            body_elem = _find_child(children, 'property', 'body')
             if body_elem is not None and body_elem.text:
-                body["body"] = self._clean_cdata(body_elem.text.strip())
-            else:
+                body["body"] = clean_cdata(body_elem.text.strip())
+            elif debug:
                 self.logger.debug(f"Body found, but no content found for ID '{body_id}'. Body seems empty.")
 
             # Get body type
-            body_type_elem = body_obj.find("./property[@name='bodyType']")
+            body_type_elem = _find_child(children, 'property', 'bodyType')
             if body_type_elem is not None and body_type_elem.text:
                 body["bodyType"] = body_type_elem.text.strip()
 
             # Find the associated content (Page, BlogPost, or Comment)
-            content_elem = body_obj.find("./property[@name='content']")
+            content_elem = _find_child(children, 'property', 'content')
             if content_elem is not None:
                 content_id_elem = content_elem.find("./id[@name='id']")
                 if content_id_elem is not None and content_id_elem.text:
@@ -923,7 +993,7 @@ class XmlProcessor:
                     content_class = content_elem.get("class")
                     body["content_class"] = content_class
                     body_page_relations.append((content_id, body))
-                else:
+                elif debug:
                     self.logger.debug(f"Content ID not found for: '{body_id}'.")
         
         self.logger.info(f"Collected {len(body_page_relations)} body-page relationships")
@@ -943,6 +1013,8 @@ class XmlProcessor:
             Tuple of (success_count, missing_count)
         """
         self.logger.info(f"Applying {len(body_page_relations)} body-page relationships")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        comments = self.comments
 
         success_count = 0
         missing_count = 0
@@ -953,56 +1025,70 @@ class XmlProcessor:
 
             # Handle comments differently from pages/blog posts
             if "Comment" in content_class:
-                if hasattr(self, 'comments') and content_id in self.comments:
-                    self.comments[content_id]["bodypage"] = body
+                comment = comments.get(content_id)
+                if comment is not None:
+                    comment["bodypage"] = body
                     success_count += 1
-                    self.logger.debug(f"Successfully linked comment '{content_id}' to body '{body['id']}'")
+                    if debug:
+                        self.logger.debug(f"Successfully linked comment '{content_id}' to body '{body['id']}'")
                 else:
                     missing_count += 1
-                    self.logger.debug(f"Could not find comment '{content_id}' for body '{body['id']}'")
+                    if debug:
+                        self.logger.debug(f"Could not find comment '{content_id}' for body '{body['id']}'")
             # Handle Pages and BlogPosts
             else:
-                if content_id in page_dict:
-                    page_dict[content_id]["bodypage"] = body
+                page = page_dict.get(content_id)
+                if page is not None:
+                    page["bodypage"] = body
                     success_count += 1
                 else:
                     missing_count += 1
-                    self.logger.debug(f"Could not find page '{content_id}' for body '{body['id']}'")
+                    if debug:
+                        self.logger.debug(f"Could not find page '{content_id}' for body '{body['id']}'")
 
         self.logger.info(f"Applied {success_count} relationships, {missing_count} pages/comments not found")
         return success_count, missing_count
 
     def _link_comments_to_pages(self) -> None:
         """Link comments to their parent pages."""
-        if not hasattr(self, 'comments'):
+        if not self.comments:
             self.logger.debug("No comments to link")
             return
 
         self.logger.debug("Linking comments to their parent pages")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         linked_count = 0
+        pages = self.page
 
         for comment_id, comment in self.comments.items():
             container_id = comment.get("containerContentId")
-            if container_id and container_id in self.page:
+            page = pages.get(container_id) if container_id else None
+            if page is not None:
                 # Add this comment to the page's comments list
-                self.page[container_id]["comments"].append(comment)
+                page["comments"].append(comment)
                 linked_count += 1
-                self.logger.debug(f"Linked comment '{comment_id}' to page '{container_id}'")
+                if debug:
+                    self.logger.debug(f"Linked comment '{comment_id}' to page '{container_id}'")
 
         self.logger.debug(f"Linked {linked_count} comments to their parent pages")
 
     def _build_helper_indexes(self) -> None:
         """Build helper indexes for faster lookups."""
-        # Space key -> Space ID
+        # Space key -> Space ID, homepage ID -> spaces, blog post ID -> Space ID
+        self._spaces_by_homepage = {}
+        self._space_by_blog_id = {}
         for space_id, space in self.spaces.items():
             if space["key"]:
                 self._space_by_key[space["key"]] = space_id
+            if space["homePageId"]:
+                self._spaces_by_homepage.setdefault(space["homePageId"], []).append(space)
+            for blog_id in space["blogPostIds"]:
+                self._space_by_blog_id.setdefault(blog_id, space_id)
 
-        # page title -> page ID
-        for page_id, page in self.page.items():
-            if page["title"]:
-                self._page_by_title[page["title"]] = page_id
+        # page title -> page ID, (title, spaceId) -> page ID (built once here instead of on every page insert)
+        self._page_by_title = {page["title"]: page_id for page_id, page in self.page.items() if page["title"]}
+        self._page_by_title_space = {(page["title"], page["spaceId"]): page_id for page_id, page in self.page.items()}
 
     def _underscore_homepage_titles(self, prepend_underscore: bool = True) -> None:
         """
@@ -1040,9 +1126,9 @@ class XmlProcessor:
                 del self._page_by_title[original_title]
                 self._page_by_title[new_title] = homepage_id
 
-            # Update the title:spaceId key
-            old_key = f"{original_title}:{space_id}"
-            new_key = f"{new_title}:{space_id}"
+            # Update the (title, spaceId) key
+            old_key = (original_title, space_id)
+            new_key = (new_title, space_id)
             if old_key in self._page_by_title_space:
                 del self._page_by_title_space[old_key]
                 self._page_by_title_space[new_key] = homepage_id
@@ -1060,23 +1146,33 @@ class XmlProcessor:
             self.logger.debug(f"Could not find a filename to sanitize: '{filename}'")
             return "unnamed"
 
+        # Same input always sanitizes the same way, so reuse earlier results
+        cached = self._sanitized_filenames.get(filename)
+        if cached is not None:
+            return cached
+
         # Store input for logging
         original_filename = filename
 
         # URL decode the filename
         filename = unquote(filename)
 
-        # Normalize Unicode characters
-        filename = unicodedata.normalize('NFKC', filename)
+        # Normalize Unicode characters (ASCII text is already normalized)
+        if not filename.isascii():
+            filename = unicodedata.normalize('NFKC', filename)
 
-        # Filter bad/invisible characters, apply URL decoding
-        filename = ''.join(c for c in filename if self.is_valid_char(c))
+        # Filter bad/invisible characters, checking each distinct character only once per run
+        table = self._valid_char_table
+        for c in set(filename):
+            if ord(c) not in table:
+                table[ord(c)] = ord(c) if self.is_valid_char(c) else None
+        filename = filename.translate(table)
         
         # Trim leading/trailing periods and spaces
         filename = filename.strip('. ')
 
         # Replace remaining problematic characters with dashes
-        filename = re.sub(INVALID_CHARS, '-', filename)
+        filename = filename.translate(INVALID_CHARS_TABLE)
 
         # Handle spaces according to configuration
         if self.config.USE_UNDERSCORE_IN_FILENAMES:
@@ -1085,10 +1181,13 @@ class XmlProcessor:
         # Ensure the filename is not empty
         if not filename:
             self.logger.warning(f"Could not sanitize filename: '{original_filename}'")
-            return self._clean_cdata(original_filename)
+            filename = original_filename
+        else:
+            self.logger.debug(f"Sanitized filename from '{original_filename}' to '{filename}'")
 
-        self.logger.debug(f"Sanitized filename from '{original_filename}' to '{filename}'")
-        return self._clean_cdata(filename)
+        filename = self._clean_cdata(filename)
+        self._sanitized_filenames[original_filename] = filename
+        return filename
     
     def _clean_cdata(self, text: str) -> str:
         """
@@ -1206,15 +1305,17 @@ class XmlProcessor:
         return self.spaces.get(space_id) if space_id else None
 
     def get_space_key_by_xml(self, xml_path: str) -> str:
-        """Extract space key from XML"""
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        for space_obj in root.findall(".//object[@class='Space']"):
-            key = space_obj.find("./property[@name='key']")
-            if key is None or not key.text:
-                continue
-
-            return key.text.strip()
+        """Extract space key from XML, reading only up to the first Space object with a key"""
+        with open(xml_path, 'rb') as xml_file:
+            for _, elem in ET.iterparse(xml_file, events=('end',)):
+                if elem.tag != 'object':
+                    continue
+                if elem.get('class') == 'Space':
+                    key = elem.find("./property[@name='key']")
+                    if key is not None and key.text:
+                        return key.text.strip()
+                # Objects are not needed once checked
+                elem.clear()
 
     def get_space_id_by_page_id(self, page_id: str) -> Optional[str]:
         """
@@ -1226,7 +1327,8 @@ class XmlProcessor:
         Returns:
         The space ID if found, None otherwise
         """
-        self.logger.info(f"Trying to get space ID for page ID: {page_id}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Trying to get space ID for page ID: {page_id}")
 
         # Get page info
         page_info = self.get_page_by_id(page_id)
@@ -1252,7 +1354,12 @@ class XmlProcessor:
         Returns:
             The space key if found, None otherwise
         """
-        self.logger.info(f"Trying to get space key for page ID: '{page_id}'")
+        space_key = self._space_key_by_page.get(page_id)
+        if space_key:
+            return space_key
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Trying to get space key for page ID: '{page_id}'")
 
         # First get the space ID
         space_id = self.get_space_id_by_page_id(page_id)
@@ -1269,6 +1376,7 @@ class XmlProcessor:
         # Get space key from space info
         space_key = space_info.get("key")
         if space_key:
+            self._space_key_by_page[page_id] = space_key
             return space_key
 
         self.logger.debug(f"No space key found for space ID: '{space_id}'")
@@ -1282,11 +1390,11 @@ class XmlProcessor:
         page_id_str = str(page_id)
 
         # Check if this is an old ID that maps to a newer version
-        if hasattr(self, 'page_id_mapping') and page_id_str in self.page_id_mapping:
-            mapped_id = self.page_id_mapping[page_id_str]
-            if mapped_id != page_id_str:
+        mapped_id = self.page_id_mapping.get(page_id_str)
+        if mapped_id is not None and mapped_id != page_id_str:
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"Mapped old ID '{page_id_str}' to newest version '{mapped_id}'")
-                page_id_str = mapped_id
+            page_id_str = mapped_id
 
         return self.page.get(page_id_str)
     
@@ -1307,13 +1415,14 @@ class XmlProcessor:
         if page and "title" in page:
             return page["title"]
         # Check if this is a space homepage
-        for _, space in self.spaces.items():
-            if space.get("homePageId") == page_id and space.get("name"):
+        homepage_spaces = self._spaces_by_homepage.get(page_id, ())
+        for space in homepage_spaces:
+            if space.get("name"):
                 return f"{space['name']} Home"
 
         # If we have a space key, try to use that
-        for _, space in self.spaces.items():
-            if space.get("homePageId") == page_id and space.get("key"):
+        for space in homepage_spaces:
+            if space.get("key"):
                 return f"{space['key']} Home"
 
         # Default fallback
@@ -1357,6 +1466,15 @@ class XmlProcessor:
                     #self.logger.debug(f"Found home page ID: '{home_page_id}'")
                     return home_page_id
 
+        # Other files resolve the same way wherever they are, so reuse earlier results
+        if filename in self._page_id_by_filename:
+            return self._page_id_by_filename[filename]
+        page_id = self._find_page_id_by_filename(filename)
+        self._page_id_by_filename[filename] = page_id
+        return page_id
+
+    def _find_page_id_by_filename(self, filename: str) -> Optional[str]:
+        """Resolve a page ID from the filename alone (numeric ID, name_ID or title), see get_page_id_by_filename."""
         # Regular file lookup by removing extension
         base_name = os.path.splitext(filename)[0]
         #self.logger.debug(f"Base name extracted: '{base_name}'")
@@ -1372,8 +1490,7 @@ class XmlProcessor:
                 return base_name
 
         # Case 2: string_numeric filename (e.g., Some-Page_48267601.html)
-        name_id_pattern = r'^(.*?)_(\d{6,10})\.html$'
-        match = re.search(name_id_pattern, filename)
+        match = FILENAME_ID_PATTERN.search(filename)
         if match:
             page_id = match.group(2)  # The numeric ID part
             #self.logger.debug(f"Extracted page ID from filename: '{page_id}'")
@@ -1384,18 +1501,25 @@ class XmlProcessor:
                 self.logger.debug(f"ID '{page_id}' not found in page cache")
 
         # Case 3: title-based filename (e.g., Some-Page.html)
-        title_pattern = r'^(.*?)(?:_\d+)?\.html$'
-        title_match = re.search(title_pattern, filename)
+        title_match = FILENAME_TITLE_PATTERN.search(filename)
         if title_match:
             title_v1 = title_match.group(1).lower()
             title_v2 = title_match.group(1).replace('-', ' ').lower()
             self.logger.debug(f"Looking for page with title similar to: '{title_v1}' or '{title_v2}'")
 
-            # Try to find page with a similar title
-            for page_id, page in self.page.items():
-                if page["title"].lower() == title_v2 or page["title"].lower() == title_v1:
-                    self.logger.debug(f"Found page with matching title: '{page_id}'")
-                    return page_id
+            # Find the first page with a similar title
+            # Build the index completely before publishing it, conversion threads look up concurrently
+            page_by_lower_title = self._page_by_lower_title
+            if page_by_lower_title is None:
+                page_by_lower_title = {}
+                for position, (page_id, page) in enumerate(self.page.items()):
+                    page_by_lower_title.setdefault(page["title"].lower(), (position, page_id))
+                self._page_by_lower_title = page_by_lower_title
+            matches = [match for match in (page_by_lower_title.get(title_v2), page_by_lower_title.get(title_v1)) if match]
+            if matches:
+                page_id = min(matches)[1]
+                self.logger.debug(f"Found page with matching title: '{page_id}'")
+                return page_id
         
         self.logger.debug(f"Could not extract page ID from filename: '{filename}'")
         return None
@@ -1409,7 +1533,8 @@ class XmlProcessor:
         space = self.get_space_by_id(space_id)
         if not space:
             return []
-        return [self.page[page_id] for page_id in space["pageIds"] if page_id in self.page]
+        pages = (self.page.get(page_id) for page_id in space["pageIds"])
+        return [page for page in pages if page is not None]
 
     def get_page_by_title(self, title: str) -> Optional[dict]:
         """Get page information by title."""
@@ -1454,7 +1579,8 @@ class XmlProcessor:
             The title of the parent page or None if not found
         """
 
-        self.logger.info(f"Trying to get parent title for page ID: '{page_id}'")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Trying to get parent title for page ID: '{page_id}'")
 
         # Get page info
         page_info = self.get_page_by_id(page_id)
@@ -1472,7 +1598,8 @@ class XmlProcessor:
         parent_info = self.get_page_by_id(parent_id)
 
         if parent_info and parent_info.get("title"):
-            self.logger.debug(f"Found parent title: '{parent_info['title']}'")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Found parent title: '{parent_info['title']}'")
             return parent_info["title"]
 
         # If all else fails, return empty
@@ -1492,20 +1619,19 @@ class XmlProcessor:
         #self.logger.info(f"Attempting to find space ID for blog ID: '{blog_id}'")
 
         # Method 1: Check if blog is referenced in any space's blogPostIds
-        for space_id, space in self.spaces.items():
-            if blog_id in space.get("blogPostIds", set()):
-                return space_id
+        space_id = self._space_by_blog_id.get(blog_id)
+        if space_id:
+            return space_id
 
         # Method 2: Check content properties for space reference
         blog = self.page.get(blog_id)
         if blog:
             for prop in blog.get("pageProperties", []):
                 if prop.get("name") == "space" and prop.get("stringValue"):
-                    space_key = prop.get("stringValue")
                     # Look up space ID by key
-                    for space_id, space in self.spaces.items():
-                        if space.get("key") == space_key:
-                            return space_id
+                    space_id = self._space_by_key.get(prop.get("stringValue"))
+                    if space_id:
+                        return space_id
 
         self.logger.debug(f"Could not find space ID for blog '{blog_id}'")
         return None
@@ -1514,38 +1640,67 @@ class XmlProcessor:
         """Get attachment information by ID."""
         return self.attachments.get(att_id)
 
+    def _get_attachments_by_page(self) -> Dict[str, List[dict]]:
+        """Group all attachments by their container page once instead of scanning them for every lookup."""
+        if self._attachments_by_page is None:
+            attachments_by_page = {}
+            for attachment in self.attachments.values():
+                # containerContent_id is always stored as a string by _extract_attachments
+                attachments_by_page.setdefault(attachment['containerContent_id'], []).append(attachment)
+            self._attachments_by_page = attachments_by_page
+        return self._attachments_by_page
+
     def get_attachments_by_page_id(self, page_id: str) -> List[dict]:
         """Get all attachments for a page."""
         # Ensure page_id is a string for consistent comparison
         page_id_str = str(page_id)
         
         # Check if this is an old ID that maps to a newer version
-        if hasattr(self, 'page_id_mapping') and page_id_str in self.page_id_mapping:
-            mapped_id = self.page_id_mapping[page_id_str]
-            if mapped_id != page_id_str:
-                page_id_str = mapped_id
+        mapped_id = self.page_id_mapping.get(page_id_str)
+        if mapped_id is not None and mapped_id != page_id_str:
+            page_id_str = mapped_id
                 
-        # Get attachments with more detailed logging
-        attachments = []
-        for att_id, attachment in self.attachments.items():
-            # Handle both string and integer page_id values
-            att_page_id = str(attachment.get('containerContent_id', ''))
-
-            if att_page_id == page_id_str:
-                attachments.append(attachment)
-                #self.logger.debug(f"Found attachment '{att_id}' for page '{page_id_str}': '{attachment.get('title', '')}'")
-        
+        # Get attachments with more detailed logging (a copy, callers may modify the list)
+        attachments = list(self._get_attachments_by_page().get(page_id_str, ()))
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         if not attachments:
-            self.logger.debug(f"No attachments found in page '{page_id_str}' (checked {len(self.attachments)} attachments)")
+            if debug:
+                self.logger.debug(f"No attachments found in page '{page_id_str}' (checked {len(self.attachments)} attachments)")
 
             # Check if the page exists in our cache
             if page_id_str not in self.page:
                 self.logger.warning(f"Page '{page_id_str}' not found in page cache")
-        else:
+        elif debug:
             self.logger.debug(f"Found {len(attachments)} attachments for page '{page_id_str}'")
         
         return attachments
 
+    def get_page_attachment_by_title(self, page_id: str, *titles: str) -> Optional[dict]:
+        """
+        Find the first attachment of a page whose title matches any of the given titles (case-insensitive).
+
+        Args:
+            page_id: The ID of the page holding the attachment
+            titles: Candidate titles, e.g. the raw and the sanitized filename
+
+        Returns:
+            The attachment dict if found, None otherwise
+        """
+        page_key = str(page_id)
+        titles_index = self._attachment_titles_by_page.get(page_key)
+        if titles_index is None:
+            titles_index = {}
+            for position, attachment in enumerate(self.get_attachments_by_page_id(page_id)):
+                titles_index.setdefault(attachment.get('title', '').lower(), (position, attachment))
+            self._attachment_titles_by_page[page_key] = titles_index
+
+        # Keep page order when several titles match different attachments
+        matches = [titles_index[key] for key in {title.lower() for title in titles} if key in titles_index]
+        if not matches:
+            return None
+        return min(matches, key=lambda match: match[0])[1]
+
     def get_attachment_by_filename(self, filename: str) -> Optional[dict]:
         """
         Find an attachment by its filename, optionally filtering by page ID.
@@ -1557,15 +1712,23 @@ class XmlProcessor:
         Returns:
             The attachment dict if found, None otherwise
         """
-        self.logger.info(f"Looking for attachment with filename: '{filename}'")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Looking for attachment with filename: '{filename}'")
 
         # Extract just the base filename without query parameters
         base_filename = os.path.basename(filename.split('?')[0])
 
-        # Try exact match
-        for _, attachment in self.attachments.items():
-            if attachment.get('title') == base_filename:
-                return attachment
+        # Try exact match (the first attachment with this title, indexed once)
+        attachment_by_title = self._attachment_by_title
+        if attachment_by_title is None:
+            attachment_by_title = {}
+            for attachment in self.attachments.values():
+                attachment_by_title.setdefault(attachment.get('title'), attachment)
+            self._attachment_by_title = attachment_by_title
+
+        attachment = attachment_by_title.get(base_filename)
+        if attachment is not None:
+            return attachment
 
         self.logger.debug(f"No attachment found for filename: '{base_filename}'")
         return None
@@ -1597,7 +1760,7 @@ class XmlProcessor:
             The attachment ID if found, None otherwise
         """
         # Try to extract page ID from the link path
-        page_match = re.search(r'/attachments/(\d+)/', link)
+        page_match = ATTACHMENT_PAGE_ID_PATTERN.search(link)
         if not page_match:
             self.logger.debug(f"Could not extract page ID from link: '{link}'")
             return None
@@ -1607,10 +1770,10 @@ class XmlProcessor:
         # Extract the filename from the link
         filename = os.path.basename(link.split('?')[0])
 
-        # Look for the attachment in our data
-        for att_id, attachment in self.attachments.items():
-            if attachment.get('page_id') == page_id and attachment.get('title') == filename:
-                return att_id
+        # Look for the attachment among the attachments of that page
+        for attachment in self._get_attachments_by_page().get(page_id, ()):
+            if attachment.get('title') == filename:
+                return attachment['id']
 
         self.logger.debug(f"No attachment ID found for link: '{link}'")
         return None
@@ -1622,17 +1785,5 @@ class XmlProcessor:
         Returns:
             dict: Mapping of {page_id: [list of attachment_ids]}
         """
-        if not hasattr(self, 'attachments'):
-            self.logger.warning("No attachments found in XML data")
-            return {}
-
-        page_attachments = {}
-
-        for att_id, attachment in self.attachments.items():
-            page_id = attachment.get('page_id')
-            if page_id:
-                if page_id not in page_attachments:
-                    page_attachments[page_id] = []
-                page_attachments[page_id].append(att_id)
-
-        return page_attachments
+        return {page_id: [attachment['id'] for attachment in attachments]
+                for page_id, attachments in self._get_attachments_by_page().items() if page_id}